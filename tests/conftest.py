@@ -0,0 +1,209 @@
+"""Small synthetic WEO files that mimic the layout of IMF releases.
+
+Tests in this folder that need real data download it from the IMF site,
+the fixtures below allow testing parsing and caching without network.
+Downloads are tested with a stand-in HTTP server, see Handler and server.
+"""
+
+import gzip
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest  # type: ignore
+
+from weo.dates import Date
+
+YEARS = list(range(1980, 2025))
+
+COUNTRIES = [
+    ("111", "USA", "United States"),
+    ("134", "DEU", "Germany"),
+    ("924", "CHN", "China"),
+    ("158", "JPN", "Japan"),
+    ("138", "NLD", "Netherlands"),
+    ("967", "UVK", "Kosovo"),
+]
+
+SUBJECTS = [
+    ("NGDP", "Gross domestic product, current prices", "National currency", "Billions"),
+    ("NGDPD", "Gross domestic product, current prices", "U.S. dollars", "Billions"),
+    ("NGDP_RPCH", "Gross domestic product, constant prices", "Percent change", ""),
+    ("LP", "Population", "Persons", "Millions"),
+    ("LUR", "Unemployment rate", "Percent of total labor force", ""),
+    ("BCA", "Current account balance", "U.S. dollars", "Billions"),
+    ("BCA_NGDPD", "Current account balance", "Percent of GDP", ""),
+]
+
+HEADER = [
+    "WEO Country Code",
+    "ISO",
+    "WEO Subject Code",
+    "Country",
+    "Subject Descriptor",
+    "Subject Notes",
+    "Units",
+    "Scale",
+    "Country/Series-specific Notes",
+    *[str(y) for y in YEARS],
+    "Estimates Start After",
+]
+
+
+def value(iso: str, code: str, year: int):
+    """Number written to synthetic file, None stands for a missing value."""
+    if year < 1985:
+        return None
+    i = [c[1] for c in COUNTRIES].index(iso)
+    j = [s[0] for s in SUBJECTS].index(code)
+    return 1000.0 * (i + 1) + 100.0 * j + (year - 1980) + 0.125
+
+
+def _cell(iso, code, year):
+    x = value(iso, code, year)
+    if x is None:
+        return "--" if iso == "UVK" else "n/a"
+    return f"{x:,.3f}"
+
+
+def make_lines(footer: str):
+    yield HEADER
+    for wcc, iso, country in COUNTRIES:
+        for code, subject, unit, scale in SUBJECTS:
+            yield [
+                wcc,
+                iso,
+                code,
+                country,
+                subject,
+                f"Notes on {subject}",
+                unit,
+                scale,
+                f"See notes for: {country} {code}",
+                *[_cell(iso, code, y) for y in YEARS],
+                "2018",
+            ]
+    yield []
+    yield [f"International Monetary Fund, World Economic Outlook Database, {footer}"]
+
+
+def write_legacy(path):
+    """Write file as released before October 2020 (ISO-8859-1)."""
+    text = "\n".join("\t".join(row) for row in make_lines("October 2019")) + "\n"
+    path.write_bytes(text.encode("iso-8859-1"))
+    return path
+
+
+def write_utf16(path):
+    """Write file as released since October 2020 (UTF-16 LE, trailing tabs)."""
+    lines = ["\t".join(row) + "\t" if row else "" for row in make_lines("April 2021")]
+    text = "\n".join(lines) + "\n"
+    path.write_bytes(text.encode("utf-16"))
+    return path
+
+
+@pytest.fixture
+def legacy_file(tmp_path):
+    yield str(write_legacy(tmp_path / "weo_2019_2.csv"))
+
+
+@pytest.fixture
+def utf16_file(tmp_path):
+    yield str(write_utf16(tmp_path / "weo_2021_1.csv"))
+
+
+@pytest.fixture(params=["legacy", "utf16"])
+def weo_file(request, tmp_path):
+    if request.param == "legacy":
+        yield str(write_legacy(tmp_path / "weo_2019_2.csv"))
+    else:
+        yield str(write_utf16(tmp_path / "weo_2021_1.csv"))
+
+
+class Handler(BaseHTTPRequestHandler):
+    files: dict = {}  # url path -> content
+    failures: dict = {}  # url path -> number of 503 responses before success
+    breaks: dict = {}  # url path -> number of responses cut in the middle
+    redirects: dict = {}  # url path -> location to redirect to
+    ranges: list = []  # Range headers received
+    statuses: list = []  # statuses sent
+    # "accept": gzip body if client accepts it, "always": gzip body anyway
+    compress: str = ""
+
+    def send_response(self, code, message=None):
+        self.statuses.append(code)
+        super().send_response(code, message)
+
+    def do_GET(self):
+        if self.path in self.redirects:
+            self.send_response(302)
+            self.send_header("Location", self.redirects[self.path])
+            self.end_headers()
+            return
+        if self.failures.get(self.path, 0) > 0:
+            self.failures[self.path] -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        if self.path not in self.files:
+            self.send_response(404)
+            self.end_headers()
+            return
+        content = self.files[self.path]
+        etag = '"%s"' % hashlib.md5(content).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        start = 0
+        if "Range" in self.headers:
+            self.ranges.append(self.headers["Range"])
+        if "Range" in self.headers and self.headers.get("If-Range", etag) == etag:
+            start = int(self.headers["Range"][6:-1])
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+        else:
+            self.send_response(200)
+            accepts = "gzip" in self.headers.get("Accept-Encoding", "")
+            if self.compress == "always" or (self.compress == "accept" and accepts):
+                content = gzip.compress(content)
+                self.send_header("Content-Encoding", "gzip")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content) - start))
+        self.end_headers()
+        if self.breaks.get(self.path, 0) > 0:
+            self.breaks[self.path] -= 1
+            self.wfile.write(content[start : start + (len(content) - start) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(content[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.files = {}
+    Handler.failures = {}
+    Handler.breaks = {}
+    Handler.redirects = {}
+    Handler.ranges = []
+    Handler.statuses = []
+    Handler.compress = ""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def url_maker(server):
+    def make_url(d: Date):
+        return f"http://127.0.0.1:{server.server_port}/{d.year}/{d.release}.csv"
+
+    return make_url
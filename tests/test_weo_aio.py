@@ -0,0 +1,81 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import weo.fetch
+from weo import WEO
+from weo.aio import AsyncWEO
+from weo.dates import Date
+from weo.manifest import Manifest
+
+from .conftest import Handler, url_maker, value, write_legacy
+
+
+def test_get_downloads_and_parses(server, tmp_path):
+    content = Path(write_legacy(tmp_path / "source.csv")).read_bytes()
+    Handler.files = {"/2019/2.csv": content}
+    client = AsyncWEO(directory=str(tmp_path), make_url=url_maker(server))
+    w = asyncio.run(client.get(2019, "Oct"))
+    assert isinstance(w, WEO)
+    assert w.getc("NGDPD").loc["2018", "DEU"] == value("DEU", "NGDPD", 2018)
+    assert (tmp_path / "weo_2019_2.csv").read_bytes() == content
+
+
+def test_concurrent_calls_are_coalesced(server, tmp_path):
+    Handler.files = {"/2019/2.csv": Path(write_legacy(tmp_path / "a.csv")).read_bytes()}
+    client = AsyncWEO(directory=str(tmp_path), make_url=url_maker(server))
+
+    async def main():
+        return await asyncio.gather(*[client.get(2019, 2) for _ in range(5)])
+
+    weos = asyncio.run(main())
+    assert all(w is weos[0] for w in weos)
+    assert Handler.statuses == [200]
+    assert not client._inflight
+    # next call after completion reads file again, without download
+    assert asyncio.run(client.get(2019, 2)) is not weos[0]
+    assert Handler.statuses == [200]
+
+
+def test_parse_in_process_pool(legacy_file):
+    with ProcessPoolExecutor(1) as pool:
+        w = asyncio.run(AsyncWEO(executor=pool).parse(legacy_file))
+    assert w.fix_year(2018).equals(WEO(legacy_file).fix_year(2018))
+
+
+def test_event_loop_is_not_blocked(legacy_file):
+    client = AsyncWEO()
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        t = asyncio.ensure_future(ticker())
+        await client.parse(legacy_file)
+        t.cancel()
+        return ticks
+
+    assert asyncio.run(main()) > 1
+
+
+def test_file_work_runs_outside_event_loop(server, tmp_path, monkeypatch):
+    Handler.files = {"/2019/2.csv": b"a" * 1000}
+    threads = []
+    finish = weo.fetch._finish
+
+    def spy(*args):
+        threads.append(threading.get_ident())
+        return finish(*args)
+
+    monkeypatch.setattr(weo.fetch, "_finish", spy)
+    path = str(tmp_path / "weo.csv")
+    url = url_maker(server)(Date(2019, 2))
+    assert asyncio.run(weo.fetch.aupdate_file(path, url))
+    assert threads and threads[0] != threading.get_ident()
+    assert Manifest.of(path).get(path).size == 1000
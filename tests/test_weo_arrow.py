@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from weo import WEO
+from weo.dataframe import read_csv
+
+from .conftest import value
+
+pytest.importorskip("pyarrow")
+
+
+def test_arrow_engine_same_as_read_csv(weo_file):
+    df, _ = read_csv(weo_file)
+    df2, _ = read_csv(weo_file, engine="pyarrow")
+    pd.testing.assert_frame_equal(df.reset_index(drop=True), df2.reset_index(drop=True))
+
+
+def test_arrow_engine_filter(weo_file):
+    kwargs = dict(codes=["NGDPD"], countries=["DEU", "FRA"], years=range(2015, 2020))
+    df, _ = read_csv(weo_file, **kwargs)
+    df2, _ = read_csv(weo_file, engine="pyarrow", **kwargs)
+    pd.testing.assert_frame_equal(df.reset_index(drop=True), df2.reset_index(drop=True))
+
+
+@pytest.mark.parametrize("dtype_backend", ["numpy", "pyarrow"])
+def test_weo_arrow_engine(weo_file, dtype_backend):
+    w = WEO(weo_file)
+    w2 = WEO(weo_file, engine="pyarrow", dtype_backend=dtype_backend)
+    assert np.array_equal(w.values, w2.values, equal_nan=True)
+    assert w2.getc("NGDPD").equals(w.getc("NGDPD"))
+    assert w2.fix_year(2018).equals(w.fix_year(2018))
+    assert w2.getc("NGDPD").loc["2018", "DEU"] == value("DEU", "NGDPD", 2018)
+
+
+def test_to_arrow_no_copy(weo_file):
+    w = WEO(weo_file, engine="pyarrow", dtype_backend="pyarrow")
+    table = w.to_arrow()
+    assert table.num_rows == len(w.df)
+    source = w.df["Country"].array._pa_array.chunks[0]
+    assert (
+        table["Country"].chunks[0].buffers()[1].address == source.buffers()[1].address
+    )
+
+
+def test_read_csv_bad_options(weo_file):
+    with pytest.raises(ValueError):
+        read_csv(weo_file, engine="python")
+    with pytest.raises(ValueError):
+        read_csv(weo_file, dtype_backend="pyarrow")
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest  # type: ignore
+
+from weo import WEO
+from weo.dataframe import WEO_ParsingError
+
+from .conftest import YEARS, value
+
+
+@pytest.fixture
+def w(weo_file):
+    yield WEO(weo_file)
+
+
+def test_getc_many(w):
+    df = w.getc_many(["NGDPD", "LUR"], countries=["DEU", "JPN"], years=[2018, 2019])
+    assert df.shape == (2, 4)
+    assert df.columns.names == ["WEO Subject Code", "ISO"]
+    assert df.loc["2019", ("LUR", "JPN")] == value("JPN", "LUR", 2019)
+
+
+def test_getc_many_matches_getc(w):
+    df = w.getc_many(w.codes)
+    for code in w.codes:
+        assert df[code].equals(w.getc(code))
+
+
+def test_get_many_accepts_pairs(w):
+    df = w.get_many([("Population", "Persons"), "LUR"], countries=["USA"])
+    assert df.columns.tolist() == [("LP", "USA"), ("LUR", "USA")]
+
+
+def test_getc_many_as_array(w):
+    cube = w.getc_many(["NGDP", "LP"], years=[2000], as_array=True)
+    assert cube.values.shape == (1, 2, 6)
+    assert cube.to_frame(year="2000").loc["LP", "CHN"] == value("CHN", "LP", 2000)
+    assert np.isnan(w.getc_many(["LP"], years=[1980], as_array=True).values).all()
+
+
+def test_getc_many_checks_input(w):
+    with pytest.raises(WEO_ParsingError):
+        w.getc_many(["XXX"])
+    with pytest.raises(WEO_ParsingError):
+        w.getc_many(["LUR"], countries=["XXX"])
+    with pytest.raises(KeyError):
+        w.getc_many(["LUR"], years=[1900])
+
+
+def test_accept_year_shapes(w):
+    assert w.population().shape == (len(w.years), 6)
+    s = w.population(2019, countries=["DEU", "JPN"])
+    assert s.index.tolist() == ["DEU", "JPN"]
+    assert s["JPN"] == value("JPN", "LP", 2019)
+    df = w.population(start_year=2020, countries="CHN")
+    assert df.shape == (1, len(YEARS) - 40)
+    assert df.loc["CHN", "2021"] == value("CHN", "LP", 2021)
+
+
+def test_accept_year_unknown_year(w):
+    with pytest.raises(KeyError):
+        w.gdp_usd(1900)
+
+
+def test_fix_year_from_cube(w):
+    df = w.fix_year(2019)
+    assert df.loc["LUR", "DEU"] == value("DEU", "LUR", 2019)
+    assert w.memory_usage()["cube"] == w.cube.values.nbytes
+    # result is writable and does not change the cube
+    df.loc["LUR", "DEU"] = -1
+    df.clip(lower=0, inplace=True)
+    assert w.fix_year(2019).loc["LUR", "DEU"] == value("DEU", "LUR", 2019)
+
+
+def test_snapshot_and_rank(w):
+    cube = w.snapshot(2018, 2020)
+    assert cube.values.shape == (3, 7, 6)
+    assert np.shares_memory(cube.values, w.cube.values)
+    assert w.rank("NGDP", 2020, n=2).index.tolist() == ["UVK", "NLD"]
+
+
+def test_to_xarray(w):
+    pytest.importorskip("xarray")
+    da = w.to_xarray()
+    assert da.dims == ("year", "WEO Subject Code", "ISO")
+    assert float(da.sel(ISO="DEU")[20, 0]) == w.fix_year(2000).loc["BCA", "DEU"]
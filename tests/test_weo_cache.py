@@ -0,0 +1,84 @@
+import shutil
+import threading
+
+import pytest  # type: ignore
+
+from weo import WEO
+from weo.cache import load, sidecar_path, to_sidecar_frame, write_sidecar
+from weo.dataframe import read_csv
+
+pytest.importorskip("pyarrow")
+
+
+def test_sidecar_is_created(weo_file):
+    WEO(weo_file, cache=True)
+    assert sidecar_path(weo_file).exists()
+
+
+def test_cached_weo_equals_parsed(weo_file):
+    w1 = WEO(weo_file)
+    WEO(weo_file, cache=True)
+    w2 = WEO(weo_file, cache=True)
+    assert w2.getc("NGDPD").equals(w1.getc("NGDPD"))
+    assert w2.variables() == w1.variables()
+    assert w2.country_name("DE") == "Germany"
+
+
+def test_cache_folder(weo_file, tmp_path):
+    folder = tmp_path / "parsed"
+    WEO(weo_file, cache=str(folder))
+    assert len(list(folder.glob("*.feather"))) == 1
+
+
+def test_cache_invalidated_on_file_change(legacy_file):
+    before = load(legacy_file)
+    path = sidecar_path(legacy_file)
+    with open(legacy_file, "rb") as f:
+        content = f.read()
+    with open(legacy_file, "wb") as f:
+        f.write(content.replace(b"1,005.125", b"1,005.500"))
+    after = load(legacy_file)
+    assert not path.exists()
+    assert sidecar_path(legacy_file).exists()
+    assert before["1985"].iloc[0] == 1005.125
+    assert after["1985"].iloc[0] == 1005.5
+
+
+def test_cached_subset(weo_file):
+    WEO(weo_file, cache=True)
+    w1 = WEO(weo_file, codes=["LUR"], countries=["JPN"], years=[2019, 2020])
+    w2 = WEO(weo_file, cache=True, codes=["LUR"], countries=["JPN"], years=[2019, 2020])
+    assert w2.getc("LUR").equals(w1.getc("LUR"))
+    assert w2.values.shape == (1, 2)
+
+
+def test_concurrent_writers(legacy_file):
+    df = to_sidecar_frame(read_csv(legacy_file)[0])
+    path = sidecar_path(legacy_file)
+    errors = []
+    barrier = threading.Barrier(4)
+
+    def work():
+        barrier.wait()
+        try:
+            write_sidecar(df, path)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+
+def test_other_file_sidecar_kept(tmp_path, legacy_file):
+    data = tmp_path / "data"
+    shutil.copy(legacy_file, data)
+    shutil.copy(legacy_file, tmp_path / "data.csv")
+    load(str(tmp_path / "data.csv"))
+    load(str(data))
+    assert sidecar_path(str(tmp_path / "data.csv")).exists()
+    assert sidecar_path(str(data)).exists()
@@ -0,0 +1,44 @@
+import pytest  # type: ignore
+
+from weo import WEO
+from weo.catalog import Catalog
+from weo.dataframe import WEO_ParsingError
+
+
+@pytest.fixture
+def catalog(legacy_file):
+    yield Catalog.from_frame(WEO(legacy_file).df)
+
+
+def test_catalog_lookups(catalog):
+    assert catalog.subject_unit_by_code["LP"] == ("Population", "Persons")
+    assert (
+        catalog.code_by_subject_unit[("Current account balance", "U.S. dollars")]
+        == "BCA"
+    )
+    assert catalog.units_by_subject["Current account balance"] == (
+        "U.S. dollars",
+        "Percent of GDP",
+    )
+    assert catalog.country_names["NLD"] == "Netherlands"
+    assert catalog.years[0] == "1980"
+    assert "UVK" in catalog.iso_set
+
+
+def test_catalog_is_read_only(catalog):
+    with pytest.raises(TypeError):
+        catalog.country_names["XXX"] = "X"  # type: ignore
+
+
+def test_weo_uses_catalog(legacy_file):
+    w = WEO(legacy_file)
+    assert w.variables("current account") == [
+        ("Current account balance", "U.S. dollars", "BCA"),
+        ("Current account balance", "Percent of GDP", "BCA_NGDPD"),
+    ]
+    assert len(w.variables()) == len(w.codes)
+    assert w.units("No such subject") == []
+    with pytest.raises(WEO_ParsingError):
+        w.getc("XXX")
+    with pytest.raises(WEO_ParsingError):
+        w.get("Population", "Percent")
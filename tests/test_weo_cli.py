@@ -0,0 +1,101 @@
+import json
+import subprocess
+import sys
+
+import pytest  # type: ignore
+
+import weo.fetch
+from weo.cli import main, year_range
+from weo.fetch import DownloadResult
+
+from .conftest import value
+
+
+def test_year_range():
+    assert year_range("2000:2002") == range(2000, 2003)
+    assert year_range("2024") == range(2024, 2025)
+    assert 2100 in year_range("2000:")
+
+
+def test_info(weo_file, capsys):
+    assert main(["info", weo_file]) == 0
+    out = capsys.readouterr().out
+    assert "codes: 7" in out
+    assert "years: 1980-2024" in out
+
+
+def test_query_csv(weo_file, capsys):
+    main(["query", weo_file, "-c", "NGDPD", "-k", "DEU,USA", "-y", "2017:2018"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "ISO,WEO Subject Code,Country,Units,Scale,2017,2018"
+    assert len(lines) == 3
+    (deu,) = [x for x in lines if x.startswith("DEU")]
+    assert deu.endswith(str(value("DEU", "NGDPD", 2018)))
+
+
+def test_query_long_and_jsonl(weo_file, capsys):
+    main(["query", weo_file, "--code", "LUR", "--country", "DEU", "-f", "long"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "ISO,WEO Subject Code,year,value"
+    assert len(lines) == 1 + 45
+    main(["query", weo_file, "--code", "LUR", "--years", "2018", "-f", "jsonl"])
+    records = [json.loads(x) for x in capsys.readouterr().out.splitlines()]
+    assert {r["code"] for r in records} == {"LUR"}
+    assert all(list(r["values"]) == ["2018"] for r in records)
+
+
+def test_convert(legacy_file, tmp_path, capsys):
+    pd = pytest.importorskip("pandas")
+    output = str(tmp_path / "out.csv")
+    assert main(["convert", legacy_file, "--to", "csv", "-o", output]) == 0
+    df = pd.read_csv(output)
+    assert df.shape[0] == 42
+
+
+def test_download(monkeypatch, tmp_path, capsys):
+    calls = []
+
+    def fake(releases, **kwargs):
+        calls.append((list(releases), kwargs))
+        return [DownloadResult(2024, 1, "weo_2024_1.csv", "", status="downloaded")]
+
+    monkeypatch.setattr(weo.fetch, "download_many", fake)
+    assert main(["download", "2024", "Apr", "-d", str(tmp_path), "-j", "2"]) == 0
+    assert calls[0][0] == [(2024, "Apr")]
+    assert calls[0][1]["max_concurrency"] == 2
+    assert "downloaded" in capsys.readouterr().out
+    assert main(["download"]) == 2
+
+
+def test_download_numeric_release(monkeypatch, tmp_path, capsys):
+    calls = []
+
+    def fake(releases, **kwargs):
+        calls.append(list(releases))
+        return [DownloadResult(2024, 1, "weo_2024_1.csv", "", status="downloaded")]
+
+    monkeypatch.setattr(weo.fetch, "download_many", fake)
+    directory = tmp_path / "weo_data"
+    assert main(["download", "2024", "1", "-d", str(directory)]) == 0
+    assert calls == [[(2024, 1)]]
+    assert directory.exists()
+
+
+def test_download_checks_release_first(tmp_path, capsys):
+    directory = tmp_path / "weo_data"
+    with pytest.raises(SystemExit):
+        main(["download", "2024", "May", "-d", str(directory)])
+    assert "release must be" in capsys.readouterr().err
+    assert main(["download", "2099", "1", "-d", str(directory)]) == 1
+    assert "future" in capsys.readouterr().err
+    assert not directory.exists()
+
+
+def test_python_m_weo(legacy_file):
+    out = subprocess.run(
+        [sys.executable, "-m", "weo", "query", legacy_file, "-c", "NGDPD", "-k", "DEU"],
+        capture_output=True,
+        text=True,
+    )
+    assert out.returncode == 0
+    assert out.stdout.count("\n") == 2
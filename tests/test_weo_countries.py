@@ -0,0 +1,59 @@
+import numpy as np
+import pytest  # type: ignore
+
+from weo import WEO
+from weo.countries import CountryResolver, fold
+from weo.dataframe import WEO_ParsingError
+
+
+@pytest.fixture
+def w(legacy_file):
+    yield WEO(legacy_file)
+
+
+def test_fold():
+    assert fold("  Côte  d'Ivoire ") == "cote d'ivoire"
+
+
+def test_to_iso3(w):
+    r = w.resolver
+    assert r.to_iso3("DE") == "DEU"
+    assert r.to_iso3("deu") == "DEU"
+    assert r.to_iso3(134) == "DEU"
+    assert r.to_iso3(134.0) == "DEU"
+    assert r.to_iso3("germany") == "DEU"
+    assert r.to_iso3("United States of America") == "USA"  # ISO 3166 name
+    assert r.to_iso3("XK") == "UVK"
+    assert r.to_iso3("Atlantis") is None
+
+
+def test_search(w):
+    assert w.resolver.search("Japan") == ["JPN"]
+    assert w.resolver.search("neth") == ["NLD"]
+    assert w.resolver.search("Gernamy") == ["DEU"]
+    assert w.resolver.search("Atlantis") == []
+
+
+def test_resolve():
+    r = CountryResolver(["DEU", "FRA"], [134, 132], ["Germany", "France"])
+    labels = ["DE", "FRA", None, "132", "Frnace", "Atlantis"] * 1000
+    result = r.resolve(labels)
+    assert result[:6].tolist() == ["DEU", "FRA", None, "FRA", None, None]
+    assert r.resolve(labels, fuzzy=True)[4] == "FRA"
+    assert len(result) == 6000
+
+
+def test_weo_country_finders(w):
+    assert w.iso_code3("Netherlands") == "NLD"
+    assert w.iso_code3("Neth") == "NLD"
+    assert w.iso_code2("Neth") == "NL"
+    assert w.iso_code2("Kosovo") == "XK"
+    assert w.country_name("XK") == "Kosovo"
+    assert w.countries("united")["ISO"].tolist() == ["USA"]
+    assert (w.to_iso3(["JP", "China"]) == np.array(["JPN", "CHN"])).all()
+    with pytest.raises(WEO_ParsingError):
+        w.iso_code3("Atlantis")
+
+
+def test_country_by_alpha2(w):
+    assert w.country("XK").equals(w.country("UVK"))
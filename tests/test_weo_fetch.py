@@ -0,0 +1,231 @@
+import hashlib
+import os
+import threading
+
+import httpx
+import pytest  # type: ignore
+
+from weo.dates import Date, download
+from weo.fetch import ChecksumError, download_many, fetch_file, part_path, update_file
+from weo.manifest import FileInfo, Manifest
+
+from .conftest import Handler, url_maker
+
+
+def test_download_many(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"a" * 1000, "/2020/1.csv": b"b" * 2000}
+    Handler.failures = {"/2020/1.csv": 1}
+    results = download_many(
+        [(2019, 2), (2020, 1), (2020, 2)],
+        directory=str(tmp_path),
+        backoff=0.01,
+        make_url=url_maker(server),
+    )
+    assert [r.status for r in results] == ["downloaded", "downloaded", "failed"]
+    assert [r.attempts for r in results] == [1, 2, 1]
+    assert results[2].error == "HTTP 404"
+    assert (tmp_path / "weo_2020_1.csv").read_bytes() == b"b" * 2000
+    assert not (tmp_path / "weo_2020_2.csv").exists()
+
+
+def test_download_many_reports_other_errors(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"a" * 1000, "/2020/1.csv": b"b" * 1000}
+    Handler.redirects = {"/2020/2.csv": "/2020/2.csv"}
+    # .part file cannot be written
+    (tmp_path / "weo_2020_1.csv.part").mkdir()
+    results = download_many(
+        [(2019, 2), (2020, 1), (2020, 2)],
+        directory=str(tmp_path),
+        backoff=0.01,
+        make_url=url_maker(server),
+    )
+    assert [r.status for r in results] == ["downloaded", "failed", "failed"]
+    assert results[1].error.startswith("IsADirectoryError")
+    assert results[2].error.startswith("TooManyRedirects")
+
+
+def test_download_many_skips_existing_files(server, tmp_path):
+    (tmp_path / "weo_2019_2.csv").write_bytes(b"old")
+    results = download_many(
+        [(2019, 2)], directory=str(tmp_path), make_url=url_maker(server)
+    )
+    assert results[0].status == "exists"
+    assert results[0].ok
+
+
+def test_download_many_gives_up(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"a"}
+    Handler.failures = {"/2019/2.csv": 10}
+    (result,) = download_many(
+        [(2019, 2)],
+        directory=str(tmp_path),
+        retries=2,
+        backoff=0.01,
+        make_url=url_maker(server),
+    )
+    assert result.status == "failed"
+    assert result.attempts == 3
+
+
+def test_fetch_file_resumes_broken_transfer(server, tmp_path):
+    content = bytes(range(256)) * 100
+    Handler.files = {"/2019/2.csv": content}
+    Handler.breaks = {"/2019/2.csv": 2}
+    path = str(tmp_path / "weo.csv")
+    info = fetch_file(path, url_maker(server)(Date(2019, 2)), backoff=0.01)
+    assert Handler.ranges == ["bytes=12800-", "bytes=19200-"]
+    assert info.size == len(content)
+    assert (tmp_path / "weo.csv").read_bytes() == content
+    assert not (tmp_path / "weo.csv.part").exists()
+
+
+def test_broken_transfer_leaves_no_file(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"a" * 1000}
+    Handler.breaks = {"/2019/2.csv": 1}
+
+    local_url = url_maker(server)(Date(2019, 2))
+
+    def fetch(path, url):
+        return fetch_file(path, local_url, retries=0)
+
+    with pytest.raises(httpx.TransportError):
+        download(2019, 2, directory=str(tmp_path), fetch=fetch)
+    path = str(tmp_path / "weo_2019_2.csv")
+    assert not os.path.exists(path)
+    assert os.path.exists(part_path(path))
+    # next call resumes
+    download(2019, 2, directory=str(tmp_path), fetch=fetch)
+    assert Handler.ranges == ["bytes=500-"]
+    assert (tmp_path / "weo_2019_2.csv").read_bytes() == b"a" * 1000
+    assert not os.path.exists(part_path(path))
+
+
+def test_changed_file_is_not_resumed(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"a" * 1000}
+    Handler.breaks = {"/2019/2.csv": 1}
+    path = str(tmp_path / "weo.csv")
+    url = url_maker(server)(Date(2019, 2))
+    with pytest.raises(httpx.TransportError):
+        fetch_file(path, url, retries=0)
+    # file republished under same url, same size
+    Handler.files = {"/2019/2.csv": b"b" * 1000}
+    fetch_file(path, url, retries=0)
+    assert Handler.ranges == ["bytes=500-"]
+    assert Handler.statuses == [200, 200]
+    assert (tmp_path / "weo.csv").read_bytes() == b"b" * 1000
+    assert os.listdir(tmp_path) == ["weo.csv"]
+
+
+def test_part_file_without_validator_is_not_resumed(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"b" * 1000}
+    path = str(tmp_path / "weo.csv")
+    (tmp_path / "weo.csv.part").write_bytes(b"a" * 500)
+    fetch_file(path, url_maker(server)(Date(2019, 2)), retries=0)
+    assert Handler.ranges == []
+    assert (tmp_path / "weo.csv").read_bytes() == b"b" * 1000
+
+
+def test_fetch_file_checks_sha256(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"a" * 1000}
+    path = str(tmp_path / "weo.csv")
+    url = url_maker(server)(Date(2019, 2))
+    with pytest.raises(ChecksumError):
+        fetch_file(path, url, retries=0, sha256="0" * 64)
+    assert not (tmp_path / "weo.csv").exists()
+
+
+def test_download_many_resumes(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"a" * 1000}
+    Handler.breaks = {"/2019/2.csv": 1}
+    (result,) = download_many(
+        [(2019, 2)], directory=str(tmp_path), backoff=0.01, make_url=url_maker(server)
+    )
+    assert result.attempts == 2
+    assert Handler.ranges == ["bytes=500-"]
+    assert (tmp_path / "weo_2019_2.csv").read_bytes() == b"a" * 1000
+
+
+def test_manifest_and_refresh(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"a" * 1000}
+    kwargs = dict(directory=str(tmp_path), make_url=url_maker(server))
+    (result,) = download_many([(2019, 2)], **kwargs)
+    info = Manifest(str(tmp_path)).get("weo_2019_2.csv")
+    assert info.size == 1000
+    assert info.sha256 == hashlib.sha256(b"a" * 1000).hexdigest()
+    assert info.etag
+    (result,) = download_many([(2019, 2)], refresh=True, **kwargs)
+    assert result.status == "not modified"
+    assert Handler.statuses == [200, 304]
+    Handler.files = {"/2019/2.csv": b"b" * 500}
+    (result,) = download_many([(2019, 2)], refresh=True, **kwargs)
+    assert result.status == "downloaded"
+    assert (tmp_path / "weo_2019_2.csv").read_bytes() == b"b" * 500
+    assert Manifest(str(tmp_path)).get("weo_2019_2.csv").size == 500
+
+
+def test_download_many_keeps_records_of_others(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"a" * 1000}
+    make_url = url_maker(server)
+
+    def make_url_and_record(d: Date):
+        # other process records a download while download_many runs
+        Manifest(str(tmp_path)).update(
+            "other.csv", FileInfo(url="other", size=1, sha256="0" * 64)
+        )
+        return make_url(d)
+
+    download_many([(2019, 2)], directory=str(tmp_path), make_url=make_url_and_record)
+    files = Manifest(str(tmp_path)).files
+    assert sorted(files) == ["other.csv", "weo_2019_2.csv"]
+
+
+def test_manifest_saved_by_many_writers(tmp_path):
+    info = FileInfo(url="x", size=1, sha256="0" * 64)
+    errors = []
+
+    def work(i):
+        # each writer is like a separate process with its own manifest
+        try:
+            for j in range(20):
+                Manifest(str(tmp_path)).update(f"weo_{i}_{j}.csv", info)
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert os.listdir(tmp_path) == ["weo_manifest.json"]
+    assert Manifest(str(tmp_path)).files
+
+
+def test_update_file(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"a" * 1000}
+    path = str(tmp_path / "weo.csv")
+    url = url_maker(server)(Date(2019, 2))
+    assert update_file(path, url) is True
+    assert update_file(path, url) is False
+    assert Handler.statuses == [200, 304]
+
+
+def test_damaged_file_is_downloaded_again(server, tmp_path):
+    Handler.files = {"/2019/2.csv": b"a" * 1000}
+    kwargs = dict(directory=str(tmp_path), make_url=url_maker(server))
+    download_many([(2019, 2)], **kwargs)
+    (tmp_path / "weo_2019_2.csv").write_bytes(b"a" * 10)
+    (result,) = download_many([(2019, 2)], **kwargs)
+    assert result.status == "downloaded"
+    assert Handler.statuses == [200, 200]
+
+
+@pytest.mark.parametrize("compress", ["accept", "always"])
+def test_fetch_file_with_gzip_server(server, tmp_path, compress):
+    content = b"1980\t1981\n" * 10000
+    Handler.files = {"/2019/2.csv": content}
+    Handler.compress = compress
+    path = str(tmp_path / "weo.csv")
+    info = fetch_file(path, url_maker(server)(Date(2019, 2)), retries=0)
+    assert (tmp_path / "weo.csv").read_bytes() == content
+    assert info.size == len(content)
@@ -0,0 +1,48 @@
+import pytest  # type: ignore
+
+from weo.dataframe import read_csv, version
+from weo.fileformat import FileFormat, detect_encoding, sniff
+
+
+@pytest.mark.parametrize(
+    "head, expected",
+    [
+        (b"WEO Country Code", ("iso-8859-1", 0)),
+        (b"\xff\xfeW\x00E\x00O\x00", ("utf-16-le", 2)),
+        (b"W\x00E\x00O\x00", ("utf-16-le", 0)),
+    ],
+)
+def test_detect_encoding(head, expected):
+    assert detect_encoding(head) == expected
+
+
+def test_sniff_legacy(legacy_file):
+    fmt = sniff(legacy_file)
+    assert fmt.encoding == "iso-8859-1"
+    assert fmt.delimiter == "\t"
+    assert fmt.read_footer(legacy_file).endswith("October 2019")
+
+
+def test_sniff_utf16(utf16_file):
+    fmt = sniff(utf16_file)
+    assert fmt.encoding == "utf-16-le"
+    assert fmt.bom == 2
+    assert fmt.read_footer(utf16_file).endswith("April 2021")
+
+
+def test_version(legacy_file, utf16_file):
+    assert version(legacy_file) == (2019, "October")
+    assert version(utf16_file) == (2021, "April")
+
+
+def test_read_csv_with_format(weo_file):
+    df, tail = read_csv(weo_file, sniff(weo_file))
+    assert len(df) == 42
+    assert df.columns[0] == "WEO Country Code"
+    assert df.columns[-1] == "Estimates Start After"
+
+
+def test_no_footer(tmp_path):
+    path = tmp_path / "x.csv"
+    path.write_text("a\tb\n1\t2\n")
+    assert sniff(str(path)) == FileFormat("iso-8859-1", "\t", 0, None)
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+HEAVY = ["pandas", "numpy", "httpx", "iso3166"]
+
+
+def run(code: str) -> str:
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert out.returncode == 0, out.stderr
+    return out.stdout.strip()
+
+
+def loaded_after(code: str):
+    check = f"import sys; {code}; print(*[m for m in {HEAVY!r} if m in sys.modules])"
+    return run(check).split()
+
+
+def seconds(code: str) -> float:
+    timer = (
+        f"import time; t = time.perf_counter(); {code}; print(time.perf_counter() - t)"
+    )
+    return min(float(run(timer)) for _ in range(3))
+
+
+def test_import_weo_is_light():
+    assert loaded_after("import weo; weo.all_releases()") == []
+    assert loaded_after("import weo.cli; weo.cli.parser()") == []
+    assert loaded_after("import weo.rows") == ["numpy"]
+
+
+def test_names_are_loaded_on_use():
+    assert loaded_after("from weo import WEO") == ["pandas", "numpy", "iso3166"]
+    assert loaded_after("import weo; weo.download_many") == ["httpx"]
+    assert run("import weo; print(weo.registry.__name__)") == "weo.registry"
+    assert "WEO" in run("import weo; print(dir(weo))")
+
+
+def test_import_time():
+    # regression guard: import weo must stay well below cost of pandas import
+    assert seconds("import weo") < seconds("import pandas") / 3
@@ -0,0 +1,23 @@
+from weo import WEO
+from weo.index import RowIndex
+
+
+def test_row_index(legacy_file):
+    df = WEO(legacy_file).df
+    ix = RowIndex(df)
+    assert len(ix.by_code("NGDPD")) == 6
+    assert len(ix.by_iso("DEU")) == 7
+    assert (ix.by_iso("DE") == ix.by_iso("DEU")).all()
+    assert (ix.by_iso("XK") == ix.by_iso("UVK")).all()
+    assert len(ix.by_iso("Kosovo")) == 0
+    assert len(ix.by_subject_and_unit("Population", "Persons")) == 6
+    assert len(ix.by_code("XXX")) == 0
+    row = ix.grid[ix.codes.get_loc("LP"), ix.isos.get_loc("JPN")]
+    assert df.iloc[row]["Country"] == "Japan"
+
+
+def test_fix_year(weo_file):
+    w = WEO(weo_file)
+    df = w.fix_year(2018)
+    assert df.shape == (7, 6)
+    assert df.loc["LP", "JPN"] == w.getc("LP").loc["2018", "JPN"]
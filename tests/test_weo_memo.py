@@ -0,0 +1,49 @@
+import pytest  # type: ignore
+
+from weo import WEO
+
+
+@pytest.fixture
+def w(legacy_file):
+    yield WEO(legacy_file, memo=4)
+
+
+def test_memo_same_results(legacy_file):
+    w, plain = WEO(legacy_file, memo=8), WEO(legacy_file)
+    assert plain.memo is None
+    for _ in range(2):
+        assert w.getc("NGDPD").equals(plain.getc("NGDPD"))
+        assert w.fix_year(2018).equals(plain.fix_year(2018))
+        assert w.country("DEU").equals(plain.country("DEU"))
+        assert w.gdp_usd(2018).equals(plain.gdp_usd(2018))
+        assert w.core_codes_describe() == plain.core_codes_describe()
+    assert w.cache_info().hits == 5
+
+
+def test_memo_normalizes_arguments(w):
+    w.gdp_usd(2018, countries=["DEU", "USA"])
+    w.gdp_usd(year="2018", countries=("DEU", "USA"))
+    w.gdp_usd(start_year=2017, end_year=2018)
+    w.gdp_usd(year=[2017, 2018])
+    w.fix_year(2018)
+    w.fix_year("2018")
+    assert w.cache_info()[:2] == (3, 3)
+
+
+def test_memo_results_are_read_only(w):
+    df = w.getc("NGDPD")
+    with pytest.raises(ValueError):
+        df.iloc[0, 0] = 1.0
+    df["new"] = 1.0
+    assert "new" not in w.getc("NGDPD").columns
+    codes = w.core_codes_describe()
+    codes.clear()
+    assert w.core_codes_describe()
+
+
+def test_memo_size_and_clear(w):
+    for code in ["NGDPD", "LUR", "LP", "NGDP_RPCH", "BCA"]:
+        w.getc(code)
+    assert w.cache_info().currsize == 4
+    w.cache_clear()
+    assert w.cache_info() == (0, 0, 4, 0)
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+
+from weo import WEO
+
+from .conftest import value
+
+
+def test_compact_same_values(weo_file):
+    w1 = WEO(weo_file)
+    w2 = WEO(weo_file, memory="compact")
+    assert w2.getc("NGDPD").equals(w1.getc("NGDPD"))
+    assert w2.fix_year(2018).equals(w1.fix_year(2018))
+    assert w2.variables() == w1.variables()
+    assert w2.iso_code3("Germany") == "DEU"
+
+
+def test_compact_frame(weo_file):
+    w = WEO(weo_file, memory="compact", dtype=np.float32)
+    assert isinstance(w.df["Units"].dtype, pd.CategoricalDtype)
+    assert "Subject Notes" not in w.df.columns
+    assert w.values.dtype == np.float32
+    assert np.shares_memory(w.df["2018"].values, w.values)
+    assert w.getc("NGDPD").loc["2018", "DEU"] == pytest.approx(
+        value("DEU", "NGDPD", 2018)
+    )
+
+
+def test_notes_loaded_on_access(weo_file):
+    w = WEO(weo_file, memory="compact", codes=["LUR"])
+    assert w.memory_usage()["notes"] == 0
+    notes = w.notes
+    assert notes["WEO Subject Code"].tolist() == w.df["WEO Subject Code"].tolist()
+    assert w.memory_usage()["notes"] > 0
+    assert WEO(weo_file, codes=["LUR"]).notes.shape == notes.shape
+
+
+def test_memory_usage(weo_file):
+    usage = WEO(weo_file).memory_usage()
+    compact_usage = WEO(weo_file, memory="compact").memory_usage()
+    assert compact_usage["df years"] == 0
+    assert compact_usage.sum() < usage.sum()
+
+
+def test_memory_mode_checked(weo_file):
+    with pytest.raises(ValueError):
+        WEO(weo_file, memory="small")
+
+
+def test_compact_cached(weo_file):
+    pytest.importorskip("pyarrow")
+    w1 = WEO(weo_file, memory="compact")
+    WEO(weo_file, cache=True)
+    w2 = WEO(weo_file, memory="compact", cache=True)
+    assert w2.getc("LUR").equals(w1.getc("LUR"))
+    assert "Subject Notes" not in w2.df.columns
+    assert len(w2.notes) == len(w2.df)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest  # type: ignore
+
+from weo.panel import WEOPanel
+
+from .conftest import value
+
+
+@pytest.fixture
+def panel(legacy_file, utf16_file):
+    yield WEOPanel.from_files({(2019, 2): legacy_file, (2021, 1): utf16_file})
+
+
+def test_panel_shape(panel):
+    assert panel.values.shape == (2, 7, 6, 45)
+    assert panel.vintages.astype(str).tolist() == ["2019-10", "2021-04"]
+
+
+def test_series(panel):
+    df = panel.series("NGDP_RPCH", "DEU")
+    assert df.shape == (2, 45)
+    assert df.loc["2019-10", "2000"] == value("DEU", "NGDP_RPCH", 2000)
+    assert np.isnan(df.loc["2021-04", "1980"])
+
+
+def test_cross_section(panel):
+    df = panel.cross_section("LP", 2010)
+    assert df.columns.tolist() == ["CHN", "DEU", "JPN", "NLD", "USA", "UVK"]
+    assert df.loc["2021-04", "JPN"] == value("JPN", "LP", 2010)
+
+
+def test_vintage(panel):
+    assert panel.vintage(2021, "Apr").shape == (7, 6, 45)
+
+
+def test_float32(legacy_file):
+    p = WEOPanel.from_files({(2019, 2): legacy_file}, dtype=np.float32)
+    assert p.nbytes == 7 * 6 * 45 * 4
+
+
+def test_missing_code(panel):
+    with pytest.raises(KeyError):
+        panel.series("XXX", "DEU")
+
+
+def test_from_directory(legacy_file, tmp_path):
+    p = WEOPanel.from_directory(str(tmp_path), releases=[(2019, 2), (2020, 1)])
+    assert p.releases == [(2019, 2)]
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest  # type: ignore
+
+import weo
+from weo import WEO, WEOPanel
+
+from .conftest import value
+
+
+@pytest.fixture
+def paths(legacy_file, utf16_file):
+    yield {(2019, 2): legacy_file, (2021, 1): utf16_file}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_many_same_as_weo(paths, workers):
+    weos = weo.load_many(paths, workers=workers)
+    assert list(weos) == list(paths)
+    for key, path in paths.items():
+        w = WEO(path)
+        assert weos[key].getc("NGDPD").equals(w.getc("NGDPD"))
+        assert weos[key].fix_year(2018).equals(w.fix_year(2018))
+
+
+def test_load_many_subset(paths):
+    weos = weo.load_many(paths, workers=2, codes=["NGDPD"], countries=["DEU"])
+    assert weos[(2019, 2)].getc("NGDPD").loc["2018", "DEU"] == value(
+        "DEU", "NGDPD", 2018
+    )
+    assert weos[(2021, 1)].codes == ["NGDPD"]
+
+
+def test_load_many_panel(paths):
+    p = weo.load_many(paths, workers=2, panel=True)
+    expected = WEOPanel.from_files(paths)
+    assert p.releases == expected.releases
+    assert np.array_equal(p.values, expected.values, equal_nan=True)
+
+
+def test_load_many_releases(tmp_path, paths):
+    weos = weo.load_many([(2019, 2), (2020, 1), (2021, 1)], directory=str(tmp_path))
+    assert list(weos) == [(2019, 2), (2021, 1)]
+
+
+def test_load_many_panel_from_paths(paths):
+    p = weo.load_many(list(paths.values()), workers=2, panel=True)
+    expected = WEOPanel.from_files(paths)
+    assert p.releases == expected.releases
+    assert np.array_equal(p.values, expected.values, equal_nan=True)
+
+
+def test_load_many_panel_needs_release(tmp_path, legacy_file):
+    path = tmp_path / "no_footnote.csv"
+    text = open(legacy_file, encoding="iso-8859-1").read()
+    path.write_text(text.split("International Monetary Fund")[0], "iso-8859-1")
+    with pytest.raises(ValueError, match="Cannot find release"):
+        weo.load_many([str(path)], panel=True)
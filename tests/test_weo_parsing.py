@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd  # type: ignore
+
+from weo import WEO
+from weo.dataframe import read_csv, to_numeric
+
+from .conftest import YEARS, value
+
+
+def test_to_numeric():
+    s = pd.Series(["9,902.554", "n/a", "--", None, "12"], dtype=object)
+    assert to_numeric(s).tolist()[0] == 9902.554
+    assert to_numeric(s).isna().tolist() == [False, True, True, True, False]
+
+
+def test_year_columns_are_float(weo_file):
+    df, _ = read_csv(weo_file)
+    assert (df[[str(y) for y in YEARS]].dtypes == float).all()
+
+
+def test_values(weo_file):
+    w = WEO(weo_file)
+    assert w.values.shape == (len(w.df), len(YEARS))
+    assert w.values.dtype == np.float64
+
+
+def test_getc_values(weo_file):
+    df = WEO(weo_file).getc("NGDPD")
+    assert df.loc["2018", "DEU"] == value("DEU", "NGDPD", 2018)
+    assert np.isnan(df.loc["1980", "UVK"])
+
+
+def test_read_csv_subset(weo_file):
+    df, tail = read_csv(weo_file, codes=["LUR", "NGDPD"], countries=["DEU"])
+    assert df["WEO Subject Code"].tolist() == ["NGDPD", "LUR"]
+    assert df["ISO"].unique().tolist() == ["DEU"]
+    assert len(tail) > 0
+
+
+def test_weo_subset(weo_file):
+    w = WEO(weo_file, codes="NGDPD", countries=["DEU", "USA"], years=range(2010, 2021))
+    assert w.codes == ["NGDPD"]
+    assert w.years == [str(y) for y in range(2010, 2021)]
+    assert "Subject Notes" in w.df.columns
+    df = w.getc("NGDPD")
+    assert df.columns.tolist() == ["USA", "DEU"]
+    assert df.loc["2018", "DEU"] == value("DEU", "NGDPD", 2018)
+
+
+def test_weo_not_contiguous_years(weo_file):
+    w = WEO(weo_file, codes="NGDPD", years=[2000, 2010])
+    assert w.years == ["2000", "2010"]
+    assert w.daterange.astype(str).tolist() == ["2000", "2010"]
+    df = w.getc("NGDPD")
+    assert df.loc["2010", "DEU"] == value("DEU", "NGDPD", 2010)
+    s = w.gdp_usd(2010)
+    assert str(s.name) == "2010"
+    assert s["DEU"] == value("DEU", "NGDPD", 2010)
+
+
+def test_weo_no_years(weo_file):
+    w = WEO(weo_file, years=[])
+    assert w.years == []
+    assert w.getc("NGDPD").shape[0] == 0
+
+
+def test_read_csv_chunks_same_types(weo_file, monkeypatch):
+    monkeypatch.setattr("weo.dataframe.CHUNKSIZE", 5)
+    df, _ = read_csv(weo_file)
+    part, _ = read_csv(weo_file, codes=["NGDPD", "LUR"])
+    assert part.dtypes.equals(df.dtypes)
+    assert {type(x) for x in part["WEO Country Code"]} == {str}
+
+
+def test_weo_without_notes(weo_file):
+    w = WEO(weo_file, codes=["NGDPD"], notes=False)
+    assert "Subject Notes" not in w.df.columns
+    assert w.notes["WEO Subject Code"].tolist() == ["NGDPD"] * len(w.df)
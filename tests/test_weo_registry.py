@@ -0,0 +1,98 @@
+import os
+import threading
+from unittest import mock
+
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+
+import weo
+from weo.dataframe import WEO, year_columns
+from weo.registry import Registry
+
+
+def test_load_returns_same_object(legacy_file):
+    r = Registry()
+    w = r.load(legacy_file)
+    assert r.load(legacy_file) is w
+    assert r.load(legacy_file, codes=["NGDPD"]) is not w
+    assert r.load(legacy_file, codes={"NGDPD"}) is r.load(legacy_file, codes=["NGDPD"])
+    info = r.info()
+    assert (info.hits, info.misses, info.items) == (3, 2, 2)
+    assert info.nbytes > 0
+
+
+@pytest.mark.parametrize("memory", ["default", "compact"])
+def test_shared_frame_is_read_only(legacy_file, memory):
+    r = Registry()
+    w = r.load(legacy_file, memory=memory)
+    expected = WEO(legacy_file, memory=memory).df
+    pd.testing.assert_frame_equal(w.df, expected)
+    year = year_columns(w.df)[0]
+    with pytest.raises(ValueError):
+        w.df.loc[w.df.index[0], year] = 0.0
+    with pytest.raises(ValueError):
+        w.df.iloc[0] = w.df.iloc[1]
+    df = w.df.copy()
+    df.loc[df.index[0], year] = 0.0
+    pd.testing.assert_frame_equal(r.load(legacy_file, memory=memory).df, expected)
+
+
+def test_changed_file_is_read_again(legacy_file):
+    r = Registry()
+    w = r.load(legacy_file)
+    stat = os.stat(legacy_file)
+    os.utime(legacy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert r.load(legacy_file) is not w
+    assert r.info().items == 1
+    assert r.info().evictions == 1
+
+
+def test_eviction_by_bytes(legacy_file, utf16_file):
+    r = Registry(max_bytes=1)
+    r.load(legacy_file)
+    w = r.load(utf16_file)
+    info = r.info()
+    assert info.items == 1
+    assert info.evictions == 1
+    assert r.load(utf16_file) is w
+
+
+def test_least_recently_used_is_evicted(legacy_file, utf16_file):
+    r = Registry(max_bytes=None)
+    a = r.load(legacy_file)
+    r.load(utf16_file)
+    r.max_bytes = r.nbytes + 1
+    r.load(legacy_file)  # now utf16 file is least recently used
+    r.load(legacy_file, codes=["LUR"])
+    assert r.load(legacy_file) is a
+    assert r.info().evictions == 1
+    assert r.info().misses == 3
+
+
+def test_one_load_for_concurrent_threads(legacy_file):
+    r = Registry()
+    results = []
+    barrier = threading.Barrier(8)
+
+    def work():
+        barrier.wait()
+        results.append(r.load(legacy_file))
+
+    with mock.patch("weo.registry.WEO", wraps=weo.WEO) as parse:
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert parse.call_count == 1
+    assert all(w is results[0] for w in results)
+    assert r.info().misses == 1
+    assert r.info().hits == 7
+
+
+def test_get_uses_registry(legacy_file, tmp_path):
+    weo.registry.default.clear()
+    w = weo.get(2019, 2, path=legacy_file)
+    assert weo.get(2019, "Oct", path=legacy_file) is w
+    assert weo.registry.default.info().hits == 1
+    weo.registry.default.clear()
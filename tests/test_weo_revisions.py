@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+
+from weo.dates import Date
+from weo.panel import WEOPanel
+from weo.revisions import (
+    first_release,
+    first_vs_latest,
+    forecast_errors,
+    latest,
+    revision,
+    revisions,
+)
+
+RELEASES = [(2019, 1), (2019, 2), (2020, 1), (2021, 1)]
+YEARS = ["2018", "2019", "2020"]
+
+
+@pytest.fixture
+def panel():
+    # one code, two countries; value = vintage number + year / 10000
+    values = np.full((4, 1, 2, 3), np.nan)
+    for v in range(4):
+        for y, year in enumerate(YEARS):
+            values[v, 0, :, y] = [v + 1 + int(year) / 10000, 10 * (v + 1)]
+    values[3, 0, 1, 2] = np.nan
+    yield WEOPanel(
+        values, RELEASES, pd.Index(["NGDP"]), pd.Index(["DEU", "USA"]), pd.Index(YEARS)
+    )
+
+
+def test_revision(panel):
+    cube = revision(panel, (2019, 1), Date(2020, 1))
+    assert cube.values.shape == (1, 2, 3)
+    assert cube.values[0, 1, 0] == 20
+    assert revision(panel, (2019, 1), (2020, 1), relative=True).values[0, 1, 0] == 2
+
+
+def test_revisions(panel):
+    cube = revisions(panel)
+    assert cube.values.shape == (3, 1, 2, 3)
+    assert cube.to_frame(**{"WEO Subject Code": "NGDP", "ISO": "USA"}).iloc[0, 0] == 10
+    assert len(cube.tidy()) == 3 * 2 * 3 - 1
+
+
+def test_revisions_chain(panel):
+    cube = revisions(panel, releases=[Date(2019, 1), Date(2020, 1), Date(2020, 2)])
+    assert cube.values.shape == (1, 1, 2, 3)
+    assert cube.values[0, 0, 1, 0] == 20
+
+
+def test_first_release(panel):
+    values = first_release(panel).values
+    # 2018 value from April 2019, 2019 value from April 2020
+    assert values[0, 1].tolist()[:2] == [10, 30]
+    assert np.isnan(values[0, 1, 2])  # no April 2021 value for USA
+
+
+def test_latest(panel):
+    assert latest(panel).values[0, 1].tolist() == [40, 40, 30]
+
+
+def test_first_vs_latest(panel):
+    assert first_vs_latest(panel).values[0, 1, 0] == 30
+
+
+def test_forecast_errors(panel):
+    # forecast for 2020 made in April 2019, outcome from April 2021 release
+    errors = forecast_errors(panel, horizon=1)
+    assert errors.values[0, 0, 2] == pytest.approx(3)
+    assert np.isnan(errors.values[0, 1]).all()  # no USA outcome for 2020
+    latest_errors = forecast_errors(panel, horizon=0, outcome="latest")
+    assert latest_errors.values[0, 1, 1:].tolist() == [30, 0]
+
+
+def test_forecast_errors_bad_outcome(panel):
+    with pytest.raises(ValueError):
+        forecast_errors(panel, outcome="final")
@@ -0,0 +1,31 @@
+import numpy as np
+
+import weo
+from weo.dataframe import read_csv
+from weo.rows import Row, iter_rows
+
+from .conftest import YEARS, value
+
+
+def test_iter_rows_matches_read_csv(weo_file):
+    df, _ = read_csv(weo_file)
+    rows = list(iter_rows(weo_file))
+    assert len(rows) == len(df)
+    assert [r.code for r in rows] == df["WEO Subject Code"].tolist()
+    values = np.array([r.values for r in rows])
+    expected = df[[str(y) for y in YEARS]].to_numpy()
+    assert np.allclose(values, expected, equal_nan=True)
+
+
+def test_iter_rows_filter(weo_file):
+    (row,) = weo.iter_rows(weo_file, codes=["NGDPD"], countries=["DEU"])
+    assert isinstance(row, Row)
+    assert row.country == "Germany"
+    assert row.years[0] == "1980"
+    assert row.values[row.years.index("2018")] == value("DEU", "NGDPD", 2018)
+    assert np.isnan(row.values[0])
+
+
+def test_iter_rows_as_dict(weo_file):
+    rows = iter_rows(weo_file, countries="UVK", as_dict=True)
+    assert {r["iso"] for r in rows} == {"UVK"}
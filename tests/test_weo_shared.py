@@ -0,0 +1,61 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest  # type: ignore
+
+from weo import WEO
+from weo.dataframe import NOTES_COLUMNS
+from weo.shared import attach, export, pack, unpack
+
+from .conftest import value
+
+
+@pytest.mark.parametrize("memory", ["default", "compact"])
+def test_attach_equals_parsed(weo_file, tmp_path, memory):
+    w = WEO(weo_file, memory=memory)
+    export(w, tmp_path / "shared")
+    a = attach(tmp_path / "shared")
+    assert a.getc("NGDPD").equals(w.getc("NGDPD"))
+    assert a.fix_year(2018).equals(w.fix_year(2018))
+    assert a.country("DEU").equals(w.country("DEU"))
+    assert a.variables() == w.variables()
+    assert len(a.notes) == len(a.df)
+
+
+def test_pack_leaves_out_notes(weo_file):
+    w = WEO(weo_file)
+    layout, arrays = pack(w)
+    assert not set(NOTES_COLUMNS) & set(layout["columns"])
+    assert layout["categories"]["Estimates Start After"] is None
+    a = unpack(layout, arrays)
+    assert a.df.columns.tolist() == [c for c in w.df.columns if c not in NOTES_COLUMNS]
+    assert a.df["Estimates Start After"].dtype == w.df["Estimates Start After"].dtype
+    assert a.notes["Subject Notes"].tolist() == w.notes["Subject Notes"].tolist()
+
+
+def test_attached_values_are_read_only_views(weo_file, tmp_path):
+    export(WEO(weo_file, memory="compact"), tmp_path / "shared")
+    a = attach(tmp_path / "shared")
+    assert not a.values.flags.writeable
+    assert np.shares_memory(a.df["2018"].values, a.values)
+    assert a.memory_usage()["df years"] == 0
+
+
+def test_export_replaces_directory(weo_file, tmp_path):
+    export(WEO(weo_file, codes=["LUR"]), tmp_path / "shared")
+    export(WEO(weo_file, codes=["NGDPD"], countries=["DEU"]), tmp_path / "shared")
+    a = attach(tmp_path / "shared")
+    assert a.codes == ["NGDPD"]
+    assert not list(tmp_path.glob("shared.*"))
+    assert a.notes["ISO"].tolist() == ["DEU"]
+
+
+def test_attach_in_other_process(weo_file, tmp_path):
+    export(WEO(weo_file), tmp_path / "shared")
+    code = (
+        "from weo.shared import attach;"
+        f"print(attach({str(tmp_path / 'shared')!r}).getc('NGDPD').loc['2018', 'DEU'])"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert float(out.stdout) == value("DEU", "NGDPD", 2018)
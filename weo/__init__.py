@@ -1,21 +1,95 @@
-import os
-from typing import Optional
+import importlib
+from typing import TYPE_CHECKING, Optional
 
-from .dataframe import WEO
 from .dates import all_releases, download
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .aio import AsyncWEO, aget
+    from .dataframe import WEO
+    from .fetch import download_many
+    from .panel import WEOPanel
+    from .parallel import load_many
+    from .rows import iter_rows
+
 # Add everything to all
-__all__ = ["all_releases", "download", "get", "WEO"]
+__all__ = [
+    "aget",
+    "AsyncWEO",
+    "all_releases",
+    "download",
+    "download_many",
+    "get",
+    "iter_rows",
+    "load_many",
+    "WEO",
+    "WEOPanel",
+]
+
+# Names imported on first use (PEP 562), so that `import weo` does not
+# import pandas, numpy or httpx: name -> module
+LAZY = {
+    "aget": ".aio",
+    "AsyncWEO": ".aio",
+    "download_many": ".fetch",
+    "iter_rows": ".rows",
+    "load_many": ".parallel",
+    "WEO": ".dataframe",
+    "WEOPanel": ".panel",
+}
+
+SUBMODULES = [
+    "aio",
+    "arrow",
+    "cache",
+    "catalog",
+    "cli",
+    "countries",
+    "cube",
+    "dataframe",
+    "dates",
+    "fetch",
+    "fileformat",
+    "index",
+    "manifest",
+    "memo",
+    "panel",
+    "parallel",
+    "registry",
+    "revisions",
+    "rows",
+    "shared",
+]
+
+
+def __getattr__(name: str):
+    if name in LAZY:
+        value = getattr(importlib.import_module(LAZY[name], __name__), name)
+    elif name in SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
-def get(year: int, release: int, path: Optional[str] = None) -> WEO:
+def __dir__():
+    return sorted(set(globals()) | set(LAZY) | set(SUBMODULES))
+
+
+def get(year: int, release: int, path: Optional[str] = None, cache=False) -> "WEO":
     """Fast-track access to dataset:
     download if not present,
     read from file if already downloaded.
+
+    Use cache=True to store parsed file in binary sidecar file
+    (see weo.cache) and skip text parsing on next calls.
+
+    Parsed releases are kept in memory (see weo.registry), next calls
+    return the same WEO object while the file is unchanged. Earlier
+    versions returned a new object on each call. As the object is
+    shared, arrays of w.df and w.values are read-only: assigning to
+    them raises ValueError, use w.df.copy() to change the data.
     """
-    from .dates import accept
+    from .registry import default
 
-    _, path, _ = accept(year, release, path)
-    if not os.path.exists(path):
-        download(year, release, path)
-    return WEO(path)
+    return default.get(year, release, path, cache=cache)
@@ -0,0 +1,122 @@
+"""Get WEO releases from async code without blocking the event loop.
+
+  import weo
+  w = await weo.aget(2024, 1)
+
+  from weo.aio import AsyncWEO
+  client = AsyncWEO(directory="weo_data", cache=True)
+  w1, w2 = await asyncio.gather(client.get(2024, 1), client.get(2024, 1))
+  assert w1 is w2  # one download and one parse
+
+Files are downloaded with httpx.AsyncClient (see weo.fetch) and parsed
+in an executor, a thread pool by default. Concurrent requests for the same
+release wait for one task, so a release is downloaded and parsed once,
+however many coroutines ask for it.
+
+With a ProcessPoolExecutor the file is parsed in another process, that
+sends back numeric arrays as weo.load_many() does.
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import httpx
+
+from .dataframe import WEO
+from .dates import Date, get_date, locate, make_url_countries
+from .fetch import aupdate_file
+from .parallel import _parse
+from .shared import unpack
+
+__all__ = ["AsyncWEO", "aget"]
+
+
+class AsyncWEO:
+    """Download and parse WEO releases from async code.
+
+    Parameters
+    ----------
+    directory : str
+        Folder for downloaded files, current folder by default.
+    cache : bool
+        Store parsed file in binary sidecar file, see weo.cache.
+    executor : concurrent.futures.Executor, optional
+        Where to parse files, default thread pool of the event loop.
+    client : httpx.AsyncClient, optional
+        Client for downloads, a new client is used for each download
+        by default.
+    make_url: callable, optional
+        Used for testing.
+    kwargs
+        Passed to WEO(), for example codes, countries, years, memory.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        cache=False,
+        executor: Optional[Executor] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        make_url: Callable[[Date], str] = make_url_countries,
+        **kwargs,
+    ):
+        self.directory = directory
+        self.executor = executor
+        self.client = client
+        self.make_url = make_url
+        self.kwargs = dict(cache=cache, **kwargs)
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+
+    async def download(
+        self, year: int, release: Union[int, str], filename: Optional[str] = None
+    ) -> str:
+        """Download release if file is not present, return path to file."""
+        d = get_date(year, release)
+        path = locate(d, filename, self.directory)
+        if not os.path.exists(path):
+            await aupdate_file(path, self.make_url(d), client=self.client)
+        return path
+
+    async def parse(self, path: str) -> WEO:
+        """Read *path* in executor."""
+        loop = asyncio.get_running_loop()
+        if isinstance(self.executor, ProcessPoolExecutor):
+            parts = await loop.run_in_executor(self.executor, _parse, path, self.kwargs)
+            return unpack(*parts)
+        return await loop.run_in_executor(
+            self.executor, lambda: WEO(path, **self.kwargs)
+        )
+
+    async def _get(self, year, release, filename) -> WEO:
+        return await self.parse(await self.download(year, release, filename))
+
+    async def get(
+        self, year: int, release: Union[int, str], filename: Optional[str] = None
+    ) -> WEO:
+        """Return WEO for release, download file if not present.
+
+        Callers that ask for the same release at the same time get
+        the same WEO object.
+        """
+        d = get_date(year, release)
+        key = (asyncio.get_running_loop(), d.year, d.release, filename)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get(year, release, filename))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # a cancelled caller does not cancel the task for other callers
+        return await asyncio.shield(task)
+
+
+# shared by aget() calls, so that concurrent calls are coalesced
+_clients = {cache: AsyncWEO(cache=cache) for cache in (False, True)}
+
+
+async def aget(year: int, release: int, path: Optional[str] = None, cache=False) -> WEO:
+    """Async version of weo.get(): download if not present,
+    parse in a thread, coalesce concurrent calls for same release.
+    """
+    return await _clients[bool(cache)].get(year, release, path)
@@ -0,0 +1,151 @@
+"""Parse WEO file with Arrow multi-threaded CSV reader.
+
+  from weo import WEO
+  w = WEO("weo.csv", engine="pyarrow")
+  w = WEO("weo.csv", engine="pyarrow", dtype_backend="pyarrow")
+  table = w.to_arrow()
+
+  from weo.arrow import read_arrow
+  table = read_arrow("weo.csv", codes=["NGDP_RPCH"])   # pyarrow.Table
+
+File is split into blocks parsed on all cores. UTF-16 files are transcoded
+to UTF-8 while reading, year values with thousands separators are cleaned
+and converted to float64 with Arrow compute functions, footnote rows
+are skipped.
+
+With dtype_backend="pyarrow" dataframe columns are backed by Arrow arrays
+of the parsed table without a copy, and WEO.to_arrow() returns them
+without a copy as well.
+
+Requires pyarrow (`pip install weo[arrow]`).
+"""
+
+from typing import Optional
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from .dataframe import (
+    NA_VALUES,
+    NOTES_COLUMNS,
+    Labels,
+    as_labels,
+    to_numeric,
+)
+from .fileformat import FileFormat, sniff
+
+__all__ = ["read_arrow", "read_csv_arrow"]
+
+# Bytes of text parsed by one thread at a time.
+BLOCK_SIZE = 1 << 20
+
+
+def _pyarrow():
+    try:
+        import pyarrow  # type: ignore
+        import pyarrow.compute  # type: ignore
+        import pyarrow.csv  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "engine='pyarrow' requires pyarrow, install with: pip install weo[arrow]"
+        )
+    return pyarrow
+
+
+def _to_float(column):
+    """Convert Arrow string *column* like "9,902.554" to float64."""
+    pa = _pyarrow()
+    pc = pa.compute
+    text = pc.replace_substring(column, ",", "")
+    try:
+        return pc.cast(text, pa.float64())
+    except pa.ArrowInvalid:
+        # text that is not a number becomes NaN, as in to_numeric()
+        return pa.array(to_numeric(pd.Series(text.to_pandas())).to_numpy())
+
+
+def _is_in(table, column: str, labels):
+    pa = _pyarrow()
+    values = pa.array(sorted(labels), pa.string())
+    return pa.compute.is_in(table[column], value_set=values)
+
+
+def read_arrow(
+    filename,
+    fmt: Optional[FileFormat] = None,
+    codes: Labels = None,
+    countries: Labels = None,
+    years: Labels = None,
+    notes: bool = True,
+    use_threads: bool = True,
+):
+    """Read WEO file to pyarrow.Table, year columns are float64.
+
+    See read_csv() for parameters.
+    """
+    pa = _pyarrow()
+    if fmt is None:
+        fmt = sniff(filename)
+    header = fmt.read_header(filename)
+    wanted = as_labels(years)
+    include = [
+        name
+        for name in header
+        if name
+        and (not name.isdigit() or wanted is None or name in wanted)
+        and (notes or name not in NOTES_COLUMNS)
+    ]
+    year_names = [c for c in include if c.isdigit()]
+    table = pa.csv.read_csv(
+        filename,
+        read_options=pa.csv.ReadOptions(
+            encoding=fmt.encoding,
+            use_threads=use_threads,
+            block_size=BLOCK_SIZE,
+            skip_rows=1,
+            column_names=header,
+        ),
+        parse_options=pa.csv.ParseOptions(
+            delimiter=fmt.delimiter,
+            # footnote line has fewer columns than header
+            invalid_row_handler=lambda row: "skip",
+        ),
+        convert_options=pa.csv.ConvertOptions(
+            include_columns=include,
+            column_types={
+                # same types as in pandas parser, where footnote line
+                # is a row with text in first column and empty others
+                "WEO Country Code": pa.string(),
+                "Estimates Start After": pa.float64(),
+                **{name: pa.string() for name in year_names},
+            },
+            null_values=NA_VALUES + [""],
+            strings_can_be_null=True,
+        ),
+    )
+    for name in year_names:
+        i = table.column_names.index(name)
+        table = table.set_column(i, name, _to_float(table[name]))
+    for column, labels in [("WEO Subject Code", codes), ("ISO", countries)]:
+        labels = as_labels(labels)
+        if labels is not None:
+            table = table.filter(_is_in(table, column, labels))
+    return table
+
+
+def read_csv_arrow(filename, fmt=None, dtype_backend="numpy", **kwargs):
+    """Same as read_csv(), parse with Arrow. Return data and footer rows.
+
+    With *dtype_backend* "pyarrow" columns of dataframe are pd.ArrowDtype,
+    otherwise same types as in read_csv().
+    """
+    table = read_arrow(filename, fmt, **kwargs)
+    if dtype_backend == "pyarrow":
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    else:
+        df = table.to_pandas()
+        # missing text is NaN in pandas parser, None in Arrow
+        text = df.columns[df.dtypes == object]
+        df[text] = df[text].fillna(np.nan)
+    ix = df["Country"].isna()
+    return df[~ix], df[ix]
@@ -0,0 +1,176 @@
+"""Binary sidecar cache for parsed WEO files.
+
+  from weo import WEO
+  w = WEO('weo.csv', cache=True)
+
+First call parses 'weo.csv' and writes a Feather (Arrow IPC) file next to it
+in '.weo_cache' folder. Later calls memory-map the sidecar and skip text
+parsing. The sidecar name includes a hash of source file content and
+`CACHE_VERSION`, so editing or replacing the source file makes a new sidecar.
+
+Requires pyarrow (`pip install weo[arrow]`).
+"""
+
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Optional, Set
+
+import pandas as pd  # type: ignore
+
+from .dataframe import (
+    CATEGORICAL_COLUMNS,
+    NOTES_COLUMNS,
+    Labels,
+    as_labels,
+    read_csv,
+    year_columns,
+)
+from .fileformat import file_hash
+
+__all__ = ["load", "sidecar_path", "file_hash", "CACHE_VERSION"]
+
+# Increase when parsing in read_csv() changes the resulting dataframe.
+CACHE_VERSION = 2
+
+DEFAULT_FOLDER = ".weo_cache"
+
+
+def _pyarrow():
+    try:
+        import pyarrow  # type: ignore
+        import pyarrow.feather  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "Parsed file cache requires pyarrow, install with: pip install weo[arrow]"
+        )
+    return pyarrow
+
+
+def cache_folder(filename: str, directory: Optional[str] = None) -> Path:
+    if directory is None:
+        return Path(filename).parent / DEFAULT_FOLDER
+    return Path(directory)
+
+
+def sidecar_path(
+    filename: str, directory: Optional[str] = None, digest: Optional[str] = None
+) -> Path:
+    """Return path to sidecar file for *filename*."""
+    if digest is None:
+        digest = file_hash(filename)
+    stem = Path(filename).name
+    return (
+        cache_folder(filename, directory)
+        / f"{stem}.{digest[:16]}.v{CACHE_VERSION}.feather"
+    )
+
+
+def _stale_sidecars(filename: str, current: Path):
+    # only sidecars of *filename*, not of "data.csv" for "data"
+    pattern = re.compile(
+        re.escape(Path(filename).name) + r"\.[0-9a-f]{16}\.v\d+\.feather"
+    )
+    for p in current.parent.iterdir():
+        if p != current and pattern.fullmatch(p.name):
+            yield p
+
+
+def to_sidecar_frame(df):
+    """Convert year columns to float and metadata columns to categoricals."""
+    df = df.reset_index(drop=True)
+    years = year_columns(df)
+    df[years] = df[years].astype(float)
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    return df
+
+
+def from_sidecar_frame(df):
+    """Restore object dtype for metadata columns, as in text-parsed dataframe."""
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype(object)
+    return df
+
+
+def write_sidecar(df, path: Path):
+    """Write dataframe prepared by to_sidecar_frame() to *path*."""
+    pa = _pyarrow()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # write under unique temporary name so that a reader never sees
+    # partial file and processes writing same sidecar do not collide
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    os.close(fd)
+    try:
+        pa.feather.write_feather(table, tmp, compression="uncompressed")
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _is_in(table, column: str, labels: Set[str]):
+    import pyarrow.compute as pc  # type: ignore
+
+    pa = _pyarrow()
+    values = table[column].cast(pa.string())
+    return pc.is_in(values, value_set=pa.array(sorted(labels), pa.string()))
+
+
+def select(
+    table,
+    codes: Labels = None,
+    countries: Labels = None,
+    years: Labels = None,
+    notes: bool = True,
+):
+    """Select columns and rows of Arrow *table* before it is converted to pandas."""
+    years = as_labels(years)
+    if years is not None:
+        table = table.select(
+            [c for c in table.column_names if not c.isdigit() or c in years]
+        )
+    if not notes:
+        table = table.select([c for c in table.column_names if c not in NOTES_COLUMNS])
+    for column, labels in [("WEO Subject Code", codes), ("ISO", countries)]:
+        labels = as_labels(labels)
+        if labels is not None:
+            table = table.filter(_is_in(table, column, labels))
+    return table
+
+
+def read_sidecar(path: Path, categorical: bool = False, **subset):
+    """Read sidecar file, *subset* is passed to select().
+    Keep metadata columns as categoricals if *categorical* is True.
+    """
+    pa = _pyarrow()
+    table = pa.feather.read_table(str(path), memory_map=True)
+    df = select(table, **subset).to_pandas()
+    return df if categorical else from_sidecar_frame(df)
+
+
+def load(
+    filename: str,
+    directory: Optional[str] = None,
+    categorical: bool = False,
+    **subset,
+):
+    """Return dataframe for *filename* from sidecar file,
+    parse *filename* and create sidecar file if it does not exist.
+
+    Use *subset* keywords (codes, countries, years, notes) to read part
+    of data, sidecar file always holds the whole file.
+    """
+    _pyarrow()
+    path = sidecar_path(filename, directory)
+    if not path.exists():
+        df, _ = read_csv(filename)
+        write_sidecar(to_sidecar_frame(df), path)
+        for stale in _stale_sidecars(filename, path):
+            stale.unlink()
+    return read_sidecar(path, categorical, **subset)
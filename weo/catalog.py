@@ -0,0 +1,101 @@
+"""Metadata of WEO dataframe: years, codes, subjects, units and countries.
+
+  c = Catalog.from_frame(w.df)
+  c.subject_unit_by_code["LUR"]  # ('Unemployment rate', 'Percent of total labor force')
+  "LUR" in c.code_set            # True
+
+Built once per WEO, catalog is read-only and holds sets for validation
+and dictionaries for lookups, so no query has to scan the dataframe.
+"""
+
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Tuple
+
+import pandas as pd  # type: ignore
+
+__all__ = ["Catalog"]
+
+
+def _unique(df, column) -> Tuple:
+    return tuple(df[column].unique().tolist())
+
+
+@dataclass(frozen=True, eq=False)
+class Catalog:
+    years: Tuple[str, ...]
+    codes: Tuple[str, ...]
+    subjects: Tuple[str, ...]
+    units: Tuple[str, ...]
+    isos: Tuple[str, ...]
+    code_set: FrozenSet[str]
+    subject_set: FrozenSet[str]
+    iso_set: FrozenSet[str]
+    # subject -> units in order of appearance
+    units_by_subject: Mapping[str, Tuple[str, ...]]
+    subject_unit_by_code: Mapping[str, Tuple[str, str]]
+    code_by_subject_unit: Mapping[Tuple[str, str], str]
+    # ISO code -> country name
+    country_names: Mapping[str, str]
+    daterange: pd.PeriodIndex
+    subject_df: pd.DataFrame
+    countries_df: pd.DataFrame
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by catalog dataframes and lookups."""
+        size = sum(
+            int(df.memory_usage(deep=True).sum())
+            for df in (self.subject_df, self.countries_df)
+        )
+        lookups = (
+            self.units_by_subject,
+            self.subject_unit_by_code,
+            self.code_by_subject_unit,
+            self.country_names,
+        )
+        return size + sum(sys.getsizeof(dict(x)) for x in lookups)
+
+    @classmethod
+    def from_frame(cls, df):
+        years = tuple(x for x in df.columns if x.isdigit())
+        subject_df = df[
+            ["WEO Subject Code", "Subject Descriptor", "Units"]
+        ].drop_duplicates()
+        units_by_subject: dict = {}
+        subject_unit_by_code: dict = {}
+        code_by_subject_unit: dict = {}
+        for code, subject, unit in subject_df.itertuples(index=False):
+            subject_unit_by_code.setdefault(code, (subject, unit))
+            code_by_subject_unit.setdefault((subject, unit), code)
+            units = units_by_subject.setdefault(subject, [])
+            if unit not in units:
+                units.append(unit)
+        countries_df = df[["WEO Country Code", "ISO", "Country"]].drop_duplicates()
+        country_names: dict = {}
+        for iso, name in zip(countries_df["ISO"], countries_df["Country"]):
+            country_names.setdefault(iso, name)
+        codes = _unique(df, "WEO Subject Code")
+        subjects = _unique(df, "Subject Descriptor")
+        isos = _unique(countries_df, "ISO")
+        return cls(
+            years=years,
+            codes=codes,
+            subjects=subjects,
+            units=_unique(df, "Units"),
+            isos=isos,
+            code_set=frozenset(codes),
+            subject_set=frozenset(subjects),
+            iso_set=frozenset(isos),
+            units_by_subject=MappingProxyType(
+                {k: tuple(v) for k, v in units_by_subject.items()}
+            ),
+            subject_unit_by_code=MappingProxyType(subject_unit_by_code),
+            code_by_subject_unit=MappingProxyType(code_by_subject_unit),
+            country_names=MappingProxyType(country_names),
+            # years loaded may be not contiguous, e.g. years=[2000, 2010]
+            daterange=pd.PeriodIndex([int(y) for y in years], freq="Y"),
+            subject_df=subject_df.set_index("WEO Subject Code"),
+            countries_df=countries_df,
+        )
@@ -0,0 +1,229 @@
+"""Command line interface.
+
+  weo download --all --directory weo_data --jobs 4
+  weo download 2024 Apr
+  weo info weo_data/weo_2024_1.csv
+  weo query weo.csv --code NGDPD --country DEU --country FRA --years 2000:2030
+  weo query weo.csv --code NGDPD,LUR --format long | head
+  weo convert weo.csv --to parquet
+
+Same as `python -m weo ...`. query prints rows as soon as they are read
+from file, so output can be piped to other programs. Modules are imported
+only by the command that needs them.
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional, Union
+
+__all__ = ["main"]
+
+FORMATS = ["csv", "long", "jsonl"]
+CONVERSIONS = {"parquet": ".parquet", "feather": ".feather", "csv": ".utf8.csv"}
+
+
+def labels(values: Optional[List[str]]) -> Optional[List[str]]:
+    """Flatten repeated and comma-separated options."""
+    if not values:
+        return None
+    return [x.strip() for v in values for x in v.split(",") if x.strip()]
+
+
+def year_range(text: Optional[str]) -> Optional[range]:
+    """Parse '2000:2030', '2000:', ':2030' or '2024' to inclusive range."""
+    if not text:
+        return None
+    start, sep, end = text.partition(":")
+    if not sep:
+        end = start
+    try:
+        return range(int(start or 0), int(end or 9999) + 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"years must be like 2000:2030, got {text}")
+
+
+def release_tag(text: str) -> Union[int, str]:
+    """Parse release like '1', '2', 'Apr' or 'Oct', digits to int."""
+    from .dates import DateError, get_season
+
+    tag: Union[int, str] = int(text) if text.isdigit() else text
+    try:
+        get_season(tag)
+    except DateError:
+        raise argparse.ArgumentTypeError(
+            f"release must be 1, 2, Apr, Oct or Sep, got {text}"
+        )
+    return tag
+
+
+def cmd_download(args) -> int:
+    from .dates import all_releases, get_date
+    from .fetch import download_many
+
+    if args.all:
+        releases = all_releases()
+    elif args.year and args.release:
+        get_date(args.year, args.release)  # DateError for future or too old release
+        releases = [(args.year, args.release)]
+    else:
+        print("weo download: give YEAR RELEASE or --all", file=sys.stderr)
+        return 2
+    os.makedirs(args.directory, exist_ok=True)
+    results = download_many(
+        releases,
+        directory=args.directory,
+        max_concurrency=args.jobs,
+        refresh=args.refresh,
+    )
+    for r in results:
+        line = f"{r.year} {r.release} {r.status} {r.path}"
+        print(line if r.ok else f"{line} {r.error}", flush=True)
+    return 0 if all(r.ok for r in results) else 1
+
+
+def cmd_info(args) -> int:
+    from .dataframe import version
+    from .fileformat import file_hash, sniff
+    from .rows import iter_rows
+
+    fmt = sniff(args.file)
+    n, codes, countries, years = 0, set(), set(), ()
+    for row in iter_rows(args.file, fmt=fmt):
+        n += 1
+        codes.add(row.code)
+        countries.add(row.iso)
+        years = row.years
+    try:
+        release = " ".join(str(x) for x in version(args.file, fmt))
+    except ValueError:
+        release = "unknown"
+    print(f"file: {args.file}")
+    print(f"release: {release}")
+    print(f"encoding: {fmt.encoding}")
+    print(f"size: {os.path.getsize(args.file)}")
+    print(f"sha256: {file_hash(args.file)}")
+    print(f"rows: {n}")
+    print(f"codes: {len(codes)}")
+    print(f"countries: {len(countries)}")
+    print(f"years: {years[0]}-{years[-1]}" if years else "years: none")
+    return 0
+
+
+def write_rows(rows, fmt: str, years: Optional[range], out) -> None:
+    import csv
+    import json
+    import math
+
+    def text(x: float) -> str:
+        return "" if math.isnan(x) else repr(float(x))
+
+    writer = csv.writer(out, lineterminator="\n")
+    header = False
+    for row in rows:
+        pairs = [
+            (y, v)
+            for y, v in zip(row.years, row.values)
+            if not years or int(y) in years
+        ]
+        if fmt == "jsonl":
+            values = {y: None if math.isnan(v) else float(v) for y, v in pairs}
+            record = dict(iso=row.iso, code=row.code, country=row.country)
+            record.update(units=row.units, scale=row.scale, values=values)
+            out.write(json.dumps(record) + "\n")
+        elif fmt == "long":
+            if not header:
+                writer.writerow(["ISO", "WEO Subject Code", "year", "value"])
+            writer.writerows([row.iso, row.code, y, text(v)] for y, v in pairs)
+        else:
+            if not header:
+                columns = ["ISO", "WEO Subject Code", "Country", "Units", "Scale"]
+                writer.writerow(columns + [y for y, _ in pairs])
+            writer.writerow(
+                [row.iso, row.code, row.country, row.units, row.scale]
+                + [text(v) for _, v in pairs]
+            )
+        header = True
+
+
+def cmd_query(args) -> int:
+    from .rows import iter_rows
+
+    rows = iter_rows(args.file, codes=labels(args.code), countries=labels(args.country))
+    write_rows(rows, args.format, args.years, sys.stdout)
+    return 0
+
+
+def cmd_convert(args) -> int:
+    from .dataframe import WEO
+
+    w = WEO(
+        args.file,
+        codes=labels(args.code),
+        countries=labels(args.country),
+        years=args.years,
+        engine=args.engine,
+    )
+    output = args.output or os.path.splitext(args.file)[0] + CONVERSIONS[args.to]
+    df = w.df.reset_index(drop=True)
+    if args.to == "parquet":
+        df.to_parquet(output, index=False)
+    elif args.to == "feather":
+        df.to_feather(output)
+    else:
+        df.to_csv(output, index=False)
+    print(output)
+    return 0
+
+
+def parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="weo", description="Download and read IMF World Economic Outlook files."
+    )
+    commands = p.add_subparsers(dest="command", required=True)
+
+    d = commands.add_parser("download", help="download releases")
+    d.add_argument("year", nargs="?", type=int)
+    d.add_argument("release", nargs="?", type=release_tag, help="1, 2, Apr, Oct or Sep")
+    d.add_argument("--all", action="store_true", help="all releases")
+    d.add_argument("--directory", "-d", default=".")
+    d.add_argument("--jobs", "-j", type=int, default=4, help="parallel downloads")
+    d.add_argument("--refresh", action="store_true", help="check files for updates")
+    d.set_defaults(func=cmd_download)
+
+    i = commands.add_parser("info", help="describe WEO file")
+    i.add_argument("file")
+    i.set_defaults(func=cmd_info)
+
+    def subset(c):
+        c.add_argument("file")
+        c.add_argument("--code", "-c", action="append", help="variable code(s)")
+        c.add_argument("--country", "-k", action="append", help="ISO code(s)")
+        c.add_argument("--years", "-y", type=year_range, help="like 2000:2030")
+
+    q = commands.add_parser("query", help="print values as csv or json lines")
+    subset(q)
+    q.add_argument("--format", "-f", choices=FORMATS, default="csv")
+    q.set_defaults(func=cmd_query)
+
+    c = commands.add_parser("convert", help="save WEO file as parquet, feather or csv")
+    subset(c)
+    c.add_argument("--to", choices=list(CONVERSIONS), default="parquet")
+    c.add_argument("--output", "-o")
+    c.add_argument("--engine", choices=["c", "pyarrow"], default="c")
+    c.set_defaults(func=cmd_convert)
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        # output closed early, e.g. piped to `head`
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, ImportError) as e:
+        print(f"weo {args.command}: {e}", file=sys.stderr)
+        return 1
@@ -0,0 +1,135 @@
+"""Resolve country identifiers to ISO codes of WEO file.
+
+  r = CountryResolver.from_frame(w.catalog.countries_df)
+  r.to_iso3("DE")                       # 'DEU'
+  r.to_iso3("germany")                  # 'DEU'
+  r.resolve(["DE", "FRA", 134, "Cote d'Ivoire", "Atlantis"])
+  # array(['DEU', 'FRA', 'DEU', 'CIV', None], dtype=object)
+  r.search("kor")                       # ['KOR'], prefix match
+  r.search("Gernamy")                   # ['DEU'], fuzzy match
+
+Identifiers are ISO3 and ISO2 codes, WEO country codes and names, both
+WEO names and names from ISO 3166 standard. Names are compared after case
+folding and removing accents. resolve() looks up each distinct identifier
+once, so long arrays with repeated labels are mapped quickly.
+"""
+
+import difflib
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+from iso3166 import countries_by_alpha3  # type: ignore
+
+__all__ = ["CountryResolver", "fold"]
+
+# ISO3 codes used in WEO that are not in ISO 3166, with codes commonly
+# used for them
+ALPHA2_EXCEPTIONS = {"UVK": "XK", "WBG": "PS"}
+
+
+def fold(name: str) -> str:
+    """Return *name* in lower case without accents and extra spaces."""
+    s = unicodedata.normalize("NFKD", str(name))
+    s = "".join(c for c in s if not unicodedata.combining(c))
+    return " ".join(s.casefold().split())
+
+
+def code_key(x) -> str:
+    """Return WEO country code as string, 134.0 and 134 become '134'."""
+    if isinstance(x, (int, np.integer, float, np.floating)):
+        return str(int(x))
+    return str(x).strip()
+
+
+def alpha2(iso3: str) -> Optional[str]:
+    if iso3 in ALPHA2_EXCEPTIONS:
+        return ALPHA2_EXCEPTIONS[iso3]
+    c = countries_by_alpha3.get(iso3)
+    return c.alpha2 if c else None
+
+
+class CountryResolver:
+    """Maps between ISO3, ISO2, WEO country code and country name."""
+
+    def __init__(self, isos: List[str], weo_codes: List, names: List[str]):
+        # rows of countries dataframe
+        self.isos = isos
+        self.names = names
+        self.folded = [fold(n) for n in names]
+        self.name: Dict[str, str] = {}
+        self.weo_code: Dict[str, str] = {}
+        self.iso2: Dict[str, str] = {}
+        # codes (ISO3, ISO2, WEO country code) -> ISO3
+        self.lookup: Dict[str, str] = {}
+        # folded names and aliases -> ISO3, used for search
+        self.by_name: Dict[str, str] = {}
+        for iso, code, name in zip(isos, weo_codes, names):
+            self.name.setdefault(iso, name)
+            self.weo_code.setdefault(iso, code_key(code))
+            self.lookup.setdefault(iso, iso)
+            self.lookup.setdefault(code_key(code), iso)
+            a2 = alpha2(iso)
+            if a2:
+                self.iso2.setdefault(iso, a2)
+                self.lookup.setdefault(a2, iso)
+            self.by_name.setdefault(fold(name), iso)
+            standard = countries_by_alpha3.get(iso)
+            if standard:
+                for alias in (standard.name, standard.apolitical_name):
+                    self.by_name.setdefault(fold(alias), iso)
+        self.iso3 = {v: k for k, v in self.iso2.items()}
+        self._keys = sorted(self.by_name)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "CountryResolver":
+        """Create from dataframe with ISO, WEO Country Code and Country columns."""
+        return cls(
+            df["ISO"].tolist(), df["WEO Country Code"].tolist(), df["Country"].tolist()
+        )
+
+    def to_iso3(self, label) -> Optional[str]:
+        """Return ISO3 code for *label* or None, no fuzzy matching."""
+        if isinstance(label, (float, np.floating)) and np.isnan(label):
+            return None
+        key = code_key(label)
+        return self.lookup.get(key.upper()) or self.by_name.get(fold(key))
+
+    def contains(self, text: str) -> np.ndarray:
+        """Boolean mask of rows, where name includes *text*."""
+        t = fold(text)
+        return np.array([t in name for name in self.folded], dtype=bool)
+
+    def search(self, text: str, limit: int = 5, cutoff: float = 0.6) -> List[str]:
+        """Return ISO3 codes of countries matching *text*: exact match of
+        any identifier, else names that start with or include *text*,
+        else names similar to *text*.
+        """
+        iso = self.to_iso3(text)
+        if iso:
+            return [iso]
+        t = fold(text)
+        found = [k for k in self._keys if k.startswith(t)]
+        found += [k for k in self._keys if t in k and not k.startswith(t)]
+        if not found:
+            found = difflib.get_close_matches(t, self._keys, n=limit, cutoff=cutoff)
+        return list(dict.fromkeys(self.by_name[k] for k in found))[:limit]
+
+    def resolve(self, labels: Iterable, fuzzy: bool = False) -> np.ndarray:
+        """Return array of ISO3 codes for *labels*, None where not found.
+
+        With *fuzzy* an unknown label gets the best match of search(),
+        if there is one.
+        """
+        codes, uniques = pd.factorize(pd.Series(list(labels), dtype=object))
+        mapped = []
+        for label in uniques:
+            iso = self.to_iso3(label)
+            if iso is None and fuzzy:
+                found = self.search(str(label), limit=1)
+                iso = found[0] if found else None
+            mapped.append(iso)
+        result = np.array(mapped + [None], dtype=object)
+        # code -1 (missing label) takes last element, None
+        return result[codes]
@@ -0,0 +1,50 @@
+"""Labelled array returned by batch queries and revision functions.
+
+  cube.values          # numpy array
+  cube.axes            # pandas Index for each axis
+  cube.tidy()          # long dataframe
+  cube.to_frame(ISO="DEU")
+  cube.to_xarray()     # requires xarray
+
+Cube is a numpy array with a pandas Index of labels for each axis.
+"""
+
+from typing import List, NamedTuple
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+__all__ = ["Cube"]
+
+
+class Cube(NamedTuple):
+    """Array of values with labels for each axis."""
+
+    values: np.ndarray
+    axes: List[pd.Index]
+
+    def tidy(self, name: str = "value", dropna: bool = True) -> pd.DataFrame:
+        """Return long dataframe with a column for each axis."""
+        index = pd.MultiIndex.from_product(self.axes)
+        df = pd.Series(self.values.ravel(), index=index, name=name).reset_index()
+        return df.dropna(subset=[name]) if dropna else df
+
+    def to_frame(self, **labels) -> pd.DataFrame:
+        """Select one label on all axes but two, e.g. cube.to_frame(ISO="DEU")."""
+        values, axes = self.values, list(self.axes)
+        for name, label in labels.items():
+            i = [a.name for a in axes].index(name)
+            values = np.take(values, axes[i].get_loc(str(label)), axis=i)
+            axes.pop(i)
+        if len(axes) != 2:
+            raise ValueError("Select labels to leave two axes, now left: %s" % axes)
+        return pd.DataFrame(values, index=axes[0], columns=axes[1])
+
+    def to_xarray(self, name: str = "value"):
+        """Return xarray.DataArray with same values and axes."""
+        try:
+            import xarray as xr  # type: ignore
+        except ImportError:
+            raise ImportError("Install xarray to export: pip install weo[xarray]")
+        coords = {a.name: a for a in self.axes}
+        return xr.DataArray(self.values, coords=coords, dims=list(coords), name=name)
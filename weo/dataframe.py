@@ -5,10 +5,18 @@
   
 """
 
+import functools
+from typing import List, Optional, Set
+
 import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 from iso3166 import countries  # type: ignore
 
+from .catalog import Catalog
+from .fileformat import NA_VALUES, FileFormat, Labels, as_labels, sniff
+from .index import RowIndex
+from .memo import CacheInfo, Memo, memoize, normalize
+
 
 class WEO_ParsingError(ValueError):
     pass
@@ -31,15 +39,175 @@ def convert(x):
         return np.nan
 
 
-def read_csv(filename):  # October 2020 and later files use UTF-16 LE encoding
-    df = pd.read_csv(filename, delimiter="\t", encoding="iso-8859-1")
-    if df.isnull().iloc[0, 0]:
-        df = pd.read_csv(filename, delimiter="\t", encoding="UTF-16 LE")
-        df.dropna(how="all", axis=1, inplace=True)
+def year_columns(df):
+    return [x for x in df.columns if x.isdigit()]
+
+
+def to_numeric(column):
+    """Convert *column* with strings like "9,902.554", "n/a" or "--" to floats.
+
+    Vectorized equivalent of column.map(convert).
+    """
+    if column.dtype == object:
+        column = column.astype(str).str.replace(",", "", regex=False)
+        column = pd.to_numeric(column, errors="coerce")
+    return column.astype(float)
+
+
+# Rows parsed at a time when rows are filtered by code or country.
+CHUNKSIZE = 1000
+
+# Long text columns, not needed to access values.
+NOTES_COLUMNS = ["Subject Notes", "Country/Series-specific Notes"]
+
+# Metadata columns that repeat same strings on many rows.
+CATEGORICAL_COLUMNS = [
+    "WEO Country Code",
+    "ISO",
+    "WEO Subject Code",
+    "Country",
+    "Subject Descriptor",
+    "Subject Notes",
+    "Units",
+    "Scale",
+    "Country/Series-specific Notes",
+]
+
+
+def keep_column(years: Optional[Set[str]], notes: bool = True):
+    """Return function to select year columns in *years*, notes columns
+    if *notes* is True, and all other columns.
+    """
+    if years is None and notes:
+        return None
+
+    def keep(column):
+        if column.isdigit():
+            return years is None or column in years
+        return notes or column not in NOTES_COLUMNS
+
+    return keep
+
+
+def select_rows(df, codes: Optional[Set[str]], isos: Optional[Set[str]]):
+    """Keep rows with *codes* and *isos*, and footer rows."""
+    keep = df["Country"].isna()
+    if codes is None:
+        selected = df["WEO Subject Code"].notna()
+    else:
+        selected = df["WEO Subject Code"].isin(codes)
+    if isos is not None:
+        selected &= df["ISO"].isin(isos)
+    return df[keep | selected]
+
+
+def read_csv(
+    filename,
+    fmt: Optional[FileFormat] = None,
+    codes: Labels = None,
+    countries: Labels = None,
+    years: Labels = None,
+    notes: bool = True,
+    engine: str = "c",
+    dtype_backend: str = "numpy",
+):
+    """Read WEO file, return data and footer rows as dataframes.
+
+    Encoding and delimiter are detected from first bytes of file
+    (October 2020 and later files use UTF-16 LE encoding), use *fmt*
+    to skip detection.
+
+    Use *codes*, *countries* (ISO codes) and *years* to read part of file.
+    Other year columns are skipped by parser, rows are filtered while
+    file is read in chunks, so skipped data is never kept in memory.
+    Use notes=False to skip notes columns.
+
+    Use engine="pyarrow" to parse with Arrow multi-threaded reader,
+    with dtype_backend="pyarrow" dataframe columns are pd.ArrowDtype
+    (see weo.arrow).
+    """
+    if fmt is None:
+        fmt = sniff(filename)
+    if engine == "pyarrow":
+        from .arrow import read_csv_arrow
+
+        return read_csv_arrow(
+            filename,
+            fmt,
+            dtype_backend=dtype_backend,
+            codes=codes,
+            countries=countries,
+            years=years,
+            notes=notes,
+        )
+    if engine != "c":
+        raise ValueError(f"engine must be 'c' or 'pyarrow', got {engine}")
+    if dtype_backend != "numpy":
+        raise ValueError("dtype_backend='pyarrow' requires engine='pyarrow'")
+    codes, isos = as_labels(codes), as_labels(countries)
+    params = dict(
+        delimiter=fmt.delimiter,
+        encoding=fmt.encoding,
+        thousands=",",
+        na_values=NA_VALUES,
+        usecols=keep_column(as_labels(years), notes),
+        # same types in every chunk, whether footnote is in the chunk or not
+        dtype={"WEO Country Code": str, "Estimates Start After": float},
+    )
+    if codes is None and isos is None:
+        df = pd.read_csv(filename, **params)
+    else:
+        chunks = pd.read_csv(filename, chunksize=CHUNKSIZE, **params)
+        df = pd.concat([select_rows(chunk, codes, isos) for chunk in chunks])
+    # lines in UTF-16 files end with a tab, which makes an extra empty column
+    empty = [c for c in df.columns if c.startswith("Unnamed") and df[c].isna().all()]
+    df.drop(columns=empty, inplace=True)
+    # parser converts year columns to floats, unless there is a value
+    # it does not recognise, in which case the column is left as strings
+    for year in year_columns(df):
+        df[year] = to_numeric(df[year])
     ix = df["Country"].isna()
     return df[~ix], df[ix]
 
 
+def compact(df, dtype=np.float32):
+    """Return dataframe with metadata columns as categoricals and
+    year columns as one *dtype* block, and read-only array of year values.
+
+    Dataframe year columns are a view of the array, values are not copied.
+    """
+    # "Estimates Start After" is also made categorical, so that there is
+    # no other float column that pandas could merge with the year block
+    for column in CATEGORICAL_COLUMNS + ["Estimates Start After"]:
+        if column in df.columns and not isinstance(
+            df[column].dtype, pd.CategoricalDtype
+        ):
+            df[column] = df[column].astype("category")
+    years = year_columns(df)
+    values = df[years].to_numpy(dtype=dtype)
+    values.flags.writeable = False
+    # keep original column order: metadata, years, "Estimates Start After"
+    start = df.columns.tolist().index(years[0]) if years else len(df.columns)
+    return insert_values(df.drop(columns=years), values, years, start), values
+
+
+def insert_values(df, values, years, start: int):
+    """Insert *values* as *years* columns of *df* at column position *start*.
+
+    Year columns are a view of *values*, the array is not copied.
+    """
+    block = pd.DataFrame(values, index=df.index, columns=years, copy=False)
+    columns = df.columns.tolist()
+    parts = [df[columns[:start]], block, df[columns[start:]]]
+    return pd.concat(parts, axis=1, copy=False)
+
+
+def frame_bytes(df: Optional[pd.DataFrame]) -> int:
+    if df is None:
+        return 0
+    return int(df.memory_usage(deep=True, index=False).sum())
+
+
 def split_footnote(s):
     import re
 
@@ -52,28 +220,62 @@ def split_footnote(s):
     return int(res[2]), res[1]
 
 
-def version(filename):
-    _, tail = read_csv(filename)
-    return split_footnote(tail.iloc[0, 0])
-
+def version(filename, fmt: Optional[FileFormat] = None):
+    """Return year and month of WEO release from footnote of *filename*."""
+    if fmt is None:
+        fmt = sniff(filename)
+    if fmt.footer is None:
+        raise WEO_ParsingError(f"Cannot find release footnote in {filename}")
+    return split_footnote(fmt.read_footer(filename))
+
+
+def selected_years(years, year=None, start_year=None, end_year=None):
+    """Return years to select from *years*, None for all years."""
+    if year is not None:
+        if isinstance(year, (int, str)):
+            return [str(year)]
+        return [str(y) for y in year]
+    if start_year is None and end_year is None:
+        return None
+    start = int(start_year) if start_year is not None else int(years[0])
+    end = int(end_year) if end_year is not None else int(years[-1])
+    return [str(y) for y in range(start, end + 1)]
+
+
+def accept_year(func):
+    """Decorate method that returns variable code or (subject, unit) pair.
+
+    Decorated method returns years x countries dataframe for this variable,
+    or, if year is given, a series by country for one year and countries x
+    years dataframe for a list of years or a range from *start_year* to
+    *end_year*. *countries* limits result to these ISO codes. Only selected
+    values are taken from value matrix.
+    """
 
-def accept_year(func):  # FIXME: make accept a country
-    def inner(self, *arg, year=None, start_year=None, end_year=None):
-        df = func(self)
+    @functools.wraps(func)
+    def inner(self, *arg, year=None, start_year=None, end_year=None, countries=None):
         if arg:
             year = arg[0]
-        elif start_year and end_year:
-            year = [start_year + y for y in range(end_year - start_year + 1)]
-        if year:
-            if isinstance(year, list):
-                year = [str(y) for y in year]
-            else:
-                year = str(year)
-
-            ts = df.transpose()[year]
-            return ts
-        else:
-            return df
+        years = selected_years(self.years, year, start_year, end_year)
+        if isinstance(countries, str):
+            countries = [countries]
+        if self.memo is None:
+            return take(self, year, years, countries)
+        one_year = isinstance(year, (int, str))
+        key = (func.__name__, normalize(years), one_year, normalize(countries))
+        return self.memo.get(key, lambda: take(self, year, years, countries))
+
+    def take(self, year, years, countries):
+        variable = func(self)
+        code = variable if isinstance(variable, str) else self.to_code(*variable)
+        cube, index, labels = self._take([code], countries, years)
+        values = cube[:, 0, :]
+        columns = pd.Index(labels, dtype=object, name="")
+        if years is None:
+            return pd.DataFrame(values, index=index, columns=columns)
+        if isinstance(year, (int, str)):
+            return pd.Series(values[0], index=columns, name=index[0])
+        return pd.DataFrame(values.T, index=columns, columns=index)
 
     return inner
 
@@ -86,6 +288,21 @@ class WEO:
 
        w = WEO('weo.csv')
 
+    Use cache=True to keep parsed file in binary sidecar file
+    and skip text parsing on next reads (requires pyarrow):
+
+       w = WEO('weo.csv', cache=True)
+
+    Load part of the file:
+
+       w = WEO('weo.csv', codes=["NGDP_RPCH"], countries=["DEU", "FRA"],
+               years=range(2000, 2030))
+
+    Use less memory, notes are read from file when .notes is accessed:
+
+       w = WEO('weo.csv', memory="compact", dtype=np.float32)
+       w.memory_usage()
+
     Attributes:
 
      - .subjects
@@ -123,17 +340,163 @@ class WEO:
         and other
     """
 
-    def __init__(self, filename, id_column="ISO"):
-        self.df, _ = read_csv(filename)
+    def __init__(
+        self,
+        filename,
+        id_column="ISO",
+        cache=False,
+        codes: Labels = None,
+        countries: Labels = None,
+        years: Labels = None,
+        notes: bool = True,
+        memory: str = "default",
+        dtype=np.float64,
+        engine: str = "c",
+        dtype_backend: str = "numpy",
+        memo: int = 0,
+    ):
+        """
+        Parameters
+        ----------
+        filename : str
+            Path to WEO file.
+        id_column : str
+            Column used to label countries in variable dataframes.
+        cache : bool or str
+            If True, keep parsed file in '.weo_cache' folder next to *filename*.
+            If str, use it as a folder for parsed files.
+        codes : list of str, optional
+            Load only these variables, e.g. ["NGDP_RPCH", "LUR"].
+        countries : list of str, optional
+            Load only these countries, by three-letter ISO code.
+        years : list of int, optional
+            Load only these years, e.g. range(2000, 2030).
+        notes : bool
+            If False, notes columns are not parsed, .notes reads them
+            from file on first access.
+        memory : str
+            "default" or "compact". In compact mode metadata columns are
+            categoricals, notes are not loaded until .notes is accessed
+            and year columns of .df share memory with .values.
+        dtype : numpy dtype
+            Type of .values, use np.float32 to halve memory for values.
+        engine : str
+            "c" (pandas parser) or "pyarrow" (multi-threaded, see weo.arrow).
+        dtype_backend : str
+            "numpy" or "pyarrow", for pd.ArrowDtype columns in .df,
+            requires engine="pyarrow".
+        memo : int
+            Keep up to *memo* results of accessors like getc(), country(),
+            fix_year() and gdp_usd() for repeated calls, see weo.memo.
+        """
+        if memory not in ("default", "compact"):
+            raise ValueError(f"memory must be 'default' or 'compact', got {memory}")
+        self._source = (filename, cache, dict(codes=codes, countries=countries))
+        self._parser = dict(engine=engine, dtype_backend=dtype_backend)
+        self._notes = None
         self.id_column = id_column
+        self.memo = Memo(memo) if memo else None
+        if memory == "compact":
+            df = self._read(years=years, notes=False, categorical=True)
+            self.df, self.values = compact(df, dtype)
+        else:
+            self.df = self._read(years=years, notes=notes)
+            # year columns as float matrix, rows are in the same order as in self.df
+            self.values = self.df[year_columns(self.df)].to_numpy(dtype=dtype)
+            self.values.flags.writeable = False
+        self.catalog = Catalog.from_frame(self.df)
+        self.index = RowIndex(self.df)
+
+    @classmethod
+    def from_parts(cls, df, values, id_column="ISO", source=None) -> "WEO":
+        """Create WEO from dataframe *df* and array of its year *values*
+        without reading a file (see weo.shared).
+
+        *source* is (filename, cache, subset) used to read notes.
+        """
+        w = cls.__new__(cls)
+        w._source = source
+        w._parser = {}
+        w._notes = None
+        w.id_column = id_column
+        w.memo = None
+        w.df = df
+        w.values = values
+        w.catalog = Catalog.from_frame(df)
+        w.index = RowIndex(df)
+        return w
+
+    def _read(self, categorical: bool = False, **kwargs):
+        filename, cache, subset = self._source
+        if cache:
+            from .cache import load
+
+            folder = None if cache is True else cache
+            return load(filename, folder, categorical=categorical, **subset, **kwargs)
+        return read_csv(filename, **subset, **self._parser, **kwargs)[0]
+
+    @property
+    def notes(self) -> pd.DataFrame:
+        """Subject and country/series-specific notes for each row of .df.
+
+        If notes are not in .df (compact mode or notes=False), they are
+        read from file on first access.
+        """
+        columns = ["WEO Subject Code", "ISO"] + NOTES_COLUMNS
+        if all(c in self.df.columns for c in NOTES_COLUMNS):
+            return self.df[columns]
+        if self._notes is None:
+            if self._source is None:
+                raise WEO_ParsingError("Notes are not available, source is unknown")
+            df = self._read(years=[], categorical=True)
+            self._notes = df[columns].astype("category")
+        return self._notes
+
+    def to_arrow(self):
+        """Return .df as pyarrow.Table. Columns of pd.ArrowDtype
+        (dtype_backend="pyarrow") are not copied.
+        """
+        from .arrow import _pyarrow
+
+        return _pyarrow().Table.from_pandas(self.df, preserve_index=False)
+
+    def cache_info(self):
+        """Return hits, misses, maxsize and current size of memo."""
+        return self.memo.cache_info() if self.memo else CacheInfo(0, 0, 0, 0)
+
+    def cache_clear(self):
+        """Drop results kept in memo."""
+        if self.memo:
+            self.memo.cache_clear()
+
+    def memory_usage(self) -> pd.Series:
+        """Return memory used by parts of WEO, in bytes."""
+        df = self.df
+        years = year_columns(df)
+        shared = bool(years) and np.shares_memory(df[years[0]].values, self.values)
+        notes = [c for c in NOTES_COLUMNS if c in df.columns]
+        metadata = [c for c in df.columns if c not in years and c not in notes]
+        return pd.Series(
+            {
+                "metadata": frame_bytes(df[metadata]),
+                "values": self.values.nbytes,
+                # in compact mode year columns are a view of .values
+                "df years": 0 if shared else frame_bytes(df[years]),
+                "notes": frame_bytes(df[notes] if notes else self._notes),
+                "index": self.index.nbytes,
+                "catalog": self.catalog.nbytes,
+                "cube": self.cube.values.nbytes if "cube" in self.__dict__ else 0,
+            },
+            name="bytes",
+        )
 
     @property
     def years(self):
-        return [x for x in self.df.columns if x.isdigit()]
+        return list(self.catalog.years)
 
     @property
     def daterange(self):
-        return pd.period_range(start=self.years[0], end=self.years[-1], freq="Y")
+        return self.catalog.daterange
 
     @property
     def core_codes(self):
@@ -167,61 +530,59 @@ class WEO:
                 "BCA",  # Current account
                 "PPPEX",  # Implied PPP conversion rate
             ]
-            if x in self.codes
+            if x in self.catalog.code_set
         ]
 
+    @memoize
     def core_codes_describe(self):
         return [(c, *self.from_code(c)) for c in self.core_codes]
 
     # subjects and codes
 
-    def _unique(self, columns):
-        return self.df[columns].drop_duplicates()
-
-    def _allowed_values(self, column):
-        return self.df[column].unique().tolist()
-
     @property
     def _subject_df(self):
-        return self._unique(
-            ["WEO Subject Code", "Subject Descriptor", "Units"]
-        ).set_index("WEO Subject Code")
+        return self.catalog.subject_df
 
     @property
     def _countries_df(self):
-        return self._unique(["WEO Country Code", "ISO", "Country"])
+        return self.catalog.countries_df
 
     @property
     def subjects(self):
-        return self._allowed_values("Subject Descriptor")
+        return list(self.catalog.subjects)
 
     @property
     def codes(self):
-        return self._allowed_values("WEO Subject Code")
+        return list(self.catalog.codes)
 
     # subjects
 
     def variables(self, pattern=None):
-        vs = [(v, u, self.to_code(v, u)) for v in self.subjects for u in self.units(v)]
+        c = self.catalog
+        vs = [
+            (v, u, c.code_by_subject_unit[(v, u)])
+            for v in c.subjects
+            for u in c.units_by_subject[v]
+        ]
         if pattern:
             return [(v, u, c) for (v, u, c) in vs if pattern.lower() in v.lower()]
         return vs
 
     def units(self, subject=None):
-        ix = self.df["Subject Descriptor"] == subject
-        return (self.df[ix] if subject else self.df)["Units"].unique().tolist()
+        if subject:
+            return list(self.catalog.units_by_subject.get(subject, ()))
+        return list(self.catalog.units)
 
     # codes
 
     def to_code(self, subject: str, unit: str):
         self.check_subject(subject)
         self.check_unit(subject, unit)
-        return self._get_by_subject_and_unit(subject, unit)["WEO Subject Code"].iloc[0]
+        return self.catalog.code_by_subject_unit[(subject, unit)]
 
     def from_code(self, variable_code: str):
         self.check_code(variable_code)
-        ix = self._subject_df.index == variable_code
-        return tuple(self._subject_df[ix].transpose().iloc[:, 0].to_list())
+        return self.catalog.subject_unit_by_code[variable_code]
 
     # countries
 
@@ -230,25 +591,46 @@ class WEO:
         include *name* as substring. The search is case-insensitive.
         """
         if name:
-            c = name.lower()
-            ix = self._countries_df["Country"].apply(lambda x: c in x.lower())
-            return self._countries_df[ix]
+            return self._countries_df[self.resolver.contains(name)]
         else:
-            return self._countries_df
+            return self._countries_df.copy()
+
+    @functools.cached_property
+    def resolver(self):
+        """weo.countries.CountryResolver for countries in this file."""
+        from .countries import CountryResolver
+
+        return CountryResolver.from_frame(self._countries_df)
 
     def iso_code3(self, country_name: str):
-        """Return three-letter ISO code for *country_name*."""
-        return self.countries(country_name).ISO.iloc[0]
+        """Return three-letter ISO code for *country_name*, which is
+        a full name or a part of it, or another identifier of a country.
+        """
+        iso = self.resolver.to_iso3(country_name)
+        if iso is None:
+            rows = np.flatnonzero(self.resolver.contains(country_name))
+            if len(rows) == 0:
+                raise WEO_ParsingError(f"Country not found: {country_name}")
+            iso = self.resolver.isos[rows[0]]
+        return iso
 
     def iso_code2(self, country_name: str):
         """Return two-letter ISO code for *country_name*."""
-        return alpha3_to_2(self.iso_code3(country_name))
+        return self.resolver.iso2[self.iso_code3(country_name)]
 
     def country_name(self, iso_code):
         """Return country name for ISO country *code*."""
         if len(iso_code) == 2:
-            iso_code = countries.get(iso_code).alpha3
-        return self.df[self.df.ISO == iso_code].Country.iloc[0]
+            iso_code = self.resolver.iso3.get(iso_code, iso_code)
+        self.check_country(iso_code)
+        return self.catalog.country_names[iso_code]
+
+    def to_iso3(self, labels, fuzzy: bool = False):
+        """Return array of ISO3 codes for *labels*, which are ISO2 or ISO3
+        codes, WEO country codes or names, None where not found.
+        See weo.countries.CountryResolver.resolve().
+        """
+        return self.resolver.resolve(labels, fuzzy)
 
     # checkers
 
@@ -260,66 +642,205 @@ class WEO:
                 + f"\nProvided {name}: {x}"
             )
 
+    # sets in catalog are used for membership test, lists for error message
+
     def check_subject(self, subject):
-        self._must_be_one_of(subject, self.subjects, "subject")
+        if subject not in self.catalog.subject_set:
+            self._must_be_one_of(subject, self.subjects, "subject")
 
     def check_unit(self, subject, unit):
-        self._must_be_one_of(unit, self.units(subject), "unit")
+        if unit not in self.catalog.units_by_subject.get(subject, ()):
+            self._must_be_one_of(unit, self.units(subject), "unit")
 
     def check_code(self, code):
-        self._must_be_one_of(code, self.codes, "code")
+        if code not in self.catalog.code_set:
+            self._must_be_one_of(code, self.codes, "code")
 
     def check_country(self, iso_code):
-        self._must_be_one_of(iso_code, self.countries().ISO.to_list(), "country")
+        if iso_code not in self.catalog.iso_set:
+            self._must_be_one_of(iso_code, list(self.catalog.isos), "country")
 
     # assessor by subject/unit or code
 
     def _get_by_subject_and_unit(self, subject: str, unit: str):
-        ix = (self.df["Subject Descriptor"] == subject) & (self.df["Units"] == unit)
-        return self.df[ix]
+        return self.df.iloc[self.index.by_subject_and_unit(subject, unit)]
 
     def _get_by_code(self, variable_code):
-        ix = self.df["WEO Subject Code"] == variable_code
-        return self.df[ix]
+        return self.df.iloc[self.index.by_code(variable_code)]
 
     def t(self, df, column):
         """Extract columns with years from *df*, make *column* an index."""
-        _df = df[self.years + [column]].set_index(column).transpose().map(convert)
+        _df = df[self.years + [column]].set_index(column).transpose()
         _df.columns.name = ""
         _df.index = self.daterange
         return _df
 
     def _extract(self, ix, column):
-        """Extract columns with years from *df*, make *column* an index."""
-        _df = (
-            self.df[ix][self.years + [column]]
-            .set_index(column)
-            .transpose()
-            .map(convert)
+        """Extract year values for rows *ix* of self.df, make *column* an index.
+
+        *ix* is a boolean mask or an array of row positions.
+        """
+        ix = np.asarray(ix)
+        _df = pd.DataFrame(
+            self.values[ix].transpose(),
+            index=self.daterange,
+            columns=self.df[column].to_numpy()[ix],
         )
         _df.columns.name = ""
-        _df.index = self.daterange
         return _df
 
+    @memoize
     def get(self, subject: str, unit: str):
-        self.check_subject(subject)
-        self.check_unit(subject, unit)
-        _df = self._get_by_subject_and_unit(subject, unit)
-        return self.t(_df, self.id_column)
+        return self.getc(self.to_code(subject, unit))
 
+    @memoize
     def getc(self, code: str):
-        self.check_code(code)
-        return self.get(*self.from_code(code))
+        cube, index, labels = self._take([code])
+        columns = pd.Index(labels, dtype=object, name="")
+        return pd.DataFrame(cube[:, 0, :], index=index, columns=columns)
+
+    # batch queries
+
+    def _year_positions(self, years) -> List[int]:
+        if years is None:
+            return list(range(len(self.catalog.years)))
+        try:
+            return [self.catalog.years.index(str(y)) for y in years]
+        except ValueError:
+            raise KeyError(f"Years not found: {years}")
+
+    def _country_labels(self, isos):
+        """Labels of *isos* in self.id_column."""
+        if self.id_column == "ISO":
+            return list(isos)
+        labels = self.df[self.id_column].to_numpy(dtype=object)
+        return [labels[self.index.iso[iso][0]] for iso in isos]
+
+    def getc_many(self, codes, countries=None, years=None, as_array=False):
+        """Values of several variables in one dataframe with columns
+        by variable code and country.
+
+           w.getc_many(["NGDP_RPCH", "PCPIPCH"], countries=["DEU", "FRA"])
+
+        Parameters
+        ----------
+        codes : list of str
+            Variable codes, e.g. ["NGDP_RPCH", "LUR"].
+        countries : list of str, optional
+            Three-letter ISO codes, default is all countries
+            that have values for *codes*.
+        years : list of int, optional
+            Default is all years.
+        as_array : bool
+            Return weo.cube.Cube with (year, code, country) array instead
+            of dataframe.
+        """
+        codes = list(codes)
+        cube, index, labels = self._take(codes, countries, years)
+        if as_array:
+            from .cube import Cube
+
+            axes = [
+                index.rename("year"),
+                pd.Index(codes, name="WEO Subject Code"),
+                pd.Index(labels, name=self.id_column),
+            ]
+            return Cube(cube, axes)
+        columns = pd.MultiIndex.from_product(
+            [codes, labels], names=["WEO Subject Code", self.id_column]
+        )
+        return pd.DataFrame(cube.reshape(len(index), -1), index=index, columns=columns)
+
+    def _take(self, codes, countries=None, years=None):
+        """Return (year, code, country) array, years and country labels."""
+        for code in codes:
+            self.check_code(code)
+        if countries is None:
+            isos = list(self.index.isos_of(codes))
+        else:
+            isos = list(countries)
+            for iso in isos:
+                self.check_country(iso)
+        yi = self._year_positions(years)
+        ci = self.index.codes.get_indexer(codes)
+        ki = self.index.isos.get_indexer(isos)
+        rows = self.index.grid[np.ix_(ci, ki)]
+        # one take from value matrix: (code, country, year)
+        cube = self.values[rows[..., None], yi]
+        cube = np.where((rows >= 0)[..., None], cube, np.nan).transpose(2, 0, 1)
+        return cube, self.daterange[yi], self._country_labels(isos)
+
+    def get_many(self, variables, countries=None, years=None, as_array=False):
+        """Same as getc_many(), *variables* are codes or (subject, unit) pairs."""
+        codes = [v if isinstance(v, str) else self.to_code(*v) for v in variables]
+        return self.getc_many(codes, countries, years, as_array)
 
     # assessors in other dimensions (WIP)
 
+    @functools.cached_property
+    def cube(self):
+        """All values as (year, code, country) weo.cube.Cube, built on first use.
+
+        Codes and countries are sorted. Array is read-only, fix_year(),
+        snapshot() and rank() return views of it.
+        """
+        from .cube import Cube
+
+        rows = self.index.grid
+        cube = self.values[rows]  # (code, country, year)
+        cube = np.where((rows >= 0)[..., None], cube, np.nan)
+        cube = np.ascontiguousarray(cube.transpose(2, 0, 1))
+        cube.flags.writeable = False
+        axes = [
+            self.daterange.rename("year"),
+            self.index.codes.rename("WEO Subject Code"),
+            self.index.isos.rename("ISO"),
+        ]
+        return Cube(cube, axes)
+
+    def _year_position(self, year) -> int:
+        try:
+            return self.catalog.years.index(str(year))
+        except ValueError:
+            raise KeyError(year)
+
+    @memoize
     def fix_year(self, year):
-        return (
-            self.df[["ISO", "WEO Subject Code", str(year)]]
-            .pivot(index="WEO Subject Code", columns="ISO", values=str(year))
-            .map(convert)
+        """Return codes x countries dataframe for *year*, a copy of
+        .cube slice that can be changed.
+        """
+        j = self._year_position(year)
+        _, codes, isos = self.cube.axes
+        return pd.DataFrame(self.cube.values[j], index=codes, columns=isos, copy=True)
+
+    def snapshot(self, start_year, end_year):
+        """Return Cube with years from *start_year* to *end_year*,
+        a view of .cube.
+        """
+        j0, j1 = self._year_position(start_year), self._year_position(end_year)
+        years, codes, isos = self.cube.axes
+        return self.cube._replace(
+            values=self.cube.values[j0 : j1 + 1], axes=[years[j0 : j1 + 1], codes, isos]
         )
 
+    def rank(self, code: str, year, n: Optional[int] = None, ascending=False):
+        """Return countries sorted by value of variable *code* in *year*,
+        top *n* countries if *n* is given.
+        """
+        self.check_code(code)
+        j = self._year_position(year)
+        c = self.cube.axes[1].get_loc(code)
+        s = pd.Series(self.cube.values[j, c], index=self.cube.axes[2], name=code)
+        s = s.dropna().sort_values(ascending=ascending)
+        return s if n is None else s.head(n)
+
+    def to_xarray(self):
+        """Return all values as xarray.DataArray with year, code and
+        country dimensions (requires xarray).
+        """
+        return self.cube.to_xarray()
+
+    @memoize
     def country(self, iso_code, year=None, compact=True):
         """
         Must add:
@@ -328,12 +849,11 @@ class WEO:
         See notes for:
             - net debt
         """
-        if len(iso_code) == 3:
-            ix = self.df.ISO == iso_code
-        elif len(iso_code) == 2:
-            ix = self.df.ISO.apply(alpha3_to_2) == iso_code
-        else:
+        if len(iso_code) not in (2, 3):
             raise WEO_ParsingError(iso_code)
+        if len(iso_code) == 2:
+            iso_code = self.resolver.iso3.get(iso_code, iso_code)
+        ix = self.index.by_iso(iso_code)
         _df = self._extract(ix, "WEO Subject Code")
         if compact:
             _df = _df[self.core_codes]
@@ -348,11 +868,11 @@ class WEO:
 
     @accept_year
     def gdp_nc(self):
-        return self.get("Gross domestic product, current prices", "National currency")
+        return ("Gross domestic product, current prices", "National currency")
 
     @accept_year
     def gdp_usd(self):
-        return self.get("Gross domestic product, current prices", "U.S. dollars")
+        return ("Gross domestic product, current prices", "U.S. dollars")
 
     def nlargest(self, n=10, year=2018):
         return self.gdp_usd(year).sort_values(ascending=False).head(n).index.tolist()
@@ -362,46 +882,45 @@ class WEO:
 
     @accept_year
     def population(self):
-        return self.get("Population", "Persons")
+        return ("Population", "Persons")
 
     @accept_year
     def gdp_pc_nc(self):
-        return self.get(
-            "Gross domestic product per capita, current prices", "National currency"
+        return (
+            "Gross domestic product per capita, current prices",
+            "National currency",
         )
 
     @accept_year
     def gdp_pc_usd(self):
-        return self.get(
-            "Gross domestic product per capita, current prices", "U.S. dollars"
-        )
+        return ("Gross domestic product per capita, current prices", "U.S. dollars")
 
     @accept_year
     def gdp_ppp(self):
-        return self.get(
+        return (
             "Gross domestic product, current prices",
             "Purchasing power parity; international dollars",
         )
 
     @accept_year
     def gdp_growth(self):
-        return self.get("Gross domestic product, constant prices", "Percent change")
+        return ("Gross domestic product, constant prices", "Percent change")
 
     @accept_year
     def current_account(self):
-        return self.get("Current account balance", "U.S. dollars")
+        return ("Current account balance", "U.S. dollars")
 
     @accept_year
     def inflation(self):
-        return self.get("Inflation, end of period consumer prices", "Percent change")
+        return ("Inflation, end of period consumer prices", "Percent change")
 
     @accept_year
     def gov_net_lending_pgdp(self):
-        return self.get("General government net lending/borrowing", "Percent of GDP")
+        return ("General government net lending/borrowing", "Percent of GDP")
 
     @accept_year
     def gov_gross_debt_pgdp(self):
-        return self.get("General government gross debt", "Percent of GDP")
+        return ("General government gross debt", "Percent of GDP")
 
     def libor_usd(self):
         return self.get(
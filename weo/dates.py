@@ -5,7 +5,7 @@ from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
-import httpx
+from .manifest import Manifest
 
 __all__ = [
     "download",
@@ -185,13 +185,19 @@ def locate(d: Date, filename: Optional[str] = None, directory: Optional[str] = N
     return os.path.normpath(path)
 
 
-# https://www.python-httpx.org/advanced/#monitoring-download-progress
 def curl(path: str, url: str):
-    with open(path, "wb") as f:
-        with httpx.stream("GET", url) as r:
-            for chunk in r.iter_bytes():
-                f.write(chunk)
-    print(path, size_str(path))
+    """Download *url* to *path*. Partial file is kept as *path*.part
+    and resumed on next call, *path* appears only when download is complete.
+
+    If *path* exists and was downloaded before, it is downloaded again
+    only if it changed on server (see weo.manifest).
+    """
+    from .fetch import update_file
+
+    if update_file(path, url):
+        print(path, size_str(path))
+    else:
+        print(path, "not modified")
     return path
 
 
@@ -213,6 +219,7 @@ def download(
     filename: Optional[str] = None,
     directory: str = ".",
     fetch=curl,
+    refresh: bool = False,
 ):
     """Download dataset from IMF WEO website by release.
 
@@ -243,6 +250,9 @@ def download(
         Directory where to write file.
     fetch: callable, optional
         Used for testing.
+    refresh: bool
+        If file already exists, check if it changed on server
+        and download again if it did.
 
     Returns
     -------
@@ -252,11 +262,11 @@ def download(
     d = get_date(year, release)
     path = locate(d, filename, directory)
     url = make_url_countries(d)
-    if os.path.exists(path):
+    if os.path.exists(path) and not refresh and Manifest.of(path).is_intact(path):
         print("Already downloaded", name(d), "at", path)
     else:
         fetch(path, url)
-        print("Downloaded", name(d))
+        print("Refreshed" if refresh else "Downloaded", name(d))
     return path, url
 
 
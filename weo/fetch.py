@@ -0,0 +1,518 @@
+"""Download WEO files: resumable transfers and many releases concurrently.
+
+  from weo.fetch import fetch_file
+  fetch_file("weo.csv", url)
+
+  from weo import download_many
+  results = download_many(directory="weo_data", max_concurrency=4)
+
+Async counterpart for code that already runs an event loop
+(e.g. Jupyter notebook):
+
+  from weo.fetch import adownload_many
+  results = await adownload_many(directory="weo_data")
+
+All requests share one httpx.AsyncClient, so connections to IMF server
+are reused. Failed requests are retried with exponential backoff,
+broken transfers resume from where they stopped.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+from .dates import Date, all_releases, get_date, locate, make_url_countries
+from .fileformat import file_hash
+from .manifest import FileInfo, Manifest, now
+
+__all__ = [
+    "DownloadResult",
+    "download_many",
+    "adownload_many",
+    "fetch_file",
+    "afetch_file",
+]
+
+# HTTP statuses worth retrying
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of downloading one release.
+
+    *status* is "downloaded", "exists" (file found locally),
+    "not modified" (file unchanged on server) or "failed".
+    """
+
+    year: int
+    release: int
+    path: str
+    url: str
+    status: str
+    size: int = 0
+    attempts: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "failed"
+
+
+class RetryableError(Exception):
+    pass
+
+
+class IncompleteDownload(RetryableError):
+    pass
+
+
+class ChecksumError(RetryableError):
+    pass
+
+
+def backoff_delay(attempt: int, backoff: float) -> float:
+    """Seconds to wait before repeating *attempt* (counted from 1)."""
+    return backoff * 2 ** (attempt - 1)
+
+
+# Transfer steps shared by sync and async code. Data is written to
+# a '.part' file next to *path*. If a transfer breaks, next attempt
+# asks the server for the rest of the file with a Range request.
+# The '.part' file is renamed to *path* only after its size and
+# checksum are verified, so *path* never holds a partial file.
+# ETag or Last-Modified of the response that started '.part' file is
+# kept in '.part.json' and sent as If-Range: if the file changed on
+# server since, server sends whole new file instead of the rest of
+# the old one. A '.part' file without validator is started again.
+# If *previous* download of *path* is known, the request is conditional
+# and server replies 304 Not Modified if file did not change.
+
+
+def part_path(path: str) -> str:
+    return path + ".part"
+
+
+def validator_path(part: str) -> str:
+    return part + ".json"
+
+
+def _validator(r: httpx.Response) -> Optional[str]:
+    """ETag or Last-Modified of response, usable in If-Range header."""
+    etag = r.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return r.headers.get("Last-Modified")
+
+
+def _discard(part: str):
+    for p in (part, validator_path(part)):
+        if os.path.exists(p):
+            os.remove(p)
+
+
+def _resume(part: str) -> Tuple[int, Optional[str]]:
+    """Return size of *part* file and validator of its content."""
+    try:
+        with open(validator_path(part), encoding="utf-8") as f:
+            validator = json.load(f)["validator"]
+    except (OSError, ValueError, KeyError):
+        validator = None
+    if validator is None or not os.path.exists(part):
+        _discard(part)
+        return 0, None
+    return os.path.getsize(part), validator
+
+
+def _open_part(part: str, r: httpx.Response):
+    # server may ignore Range header and send whole file with status 200
+    if r.status_code == 206:
+        return open(part, "ab")
+    _discard(part)
+    validator = _validator(r)
+    if validator is not None:
+        with open(validator_path(part), "w", encoding="utf-8") as f:
+            json.dump({"validator": validator}, f)
+    return open(part, "wb")
+
+
+def _headers(
+    offset: int, validator: Optional[str], path: str, previous: Optional[FileInfo]
+) -> dict:
+    # ask for file bytes as they are: sizes and ranges in headers refer to
+    # encoded body, while httpx yields decoded (e.g. gunzipped) bytes
+    headers = {"Accept-Encoding": "identity"}
+    if offset and validator:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+    elif previous is not None and os.path.exists(path):
+        headers.update(previous.conditional_headers())
+    return headers
+
+
+def _expected_size(r: httpx.Response, offset: int) -> Optional[int]:
+    """Return full file size from response headers, if known."""
+    if r.headers.get("Content-Encoding", "identity") != "identity":
+        # server compressed the body anyway, size of decoded file is unknown
+        return None
+    if r.status_code == 206:
+        # Content-Range: bytes 100-999/1000
+        total = r.headers.get("Content-Range", "").rpartition("/")[2]
+        return int(total) if total.isdigit() else None
+    length = r.headers.get("Content-Length")
+    return int(length) if length and length.isdigit() else None
+
+
+def _check_response(r: httpx.Response, part: str):
+    if r.status_code == 416:
+        # part file does not match file on server, start again
+        _discard(part)
+        raise RetryableError("HTTP 416, range not satisfiable")
+    if r.status_code in RETRY_STATUSES:
+        raise RetryableError(f"HTTP {r.status_code}")
+    r.raise_for_status()
+
+
+def _finish(
+    part: str, path: str, r: httpx.Response, offset: int, sha256: Optional[str]
+) -> FileInfo:
+    url = str(r.request.url)
+    expected = _expected_size(r, offset)
+    size = os.path.getsize(part)
+    if expected is not None and size != expected:
+        if size > expected:
+            _discard(part)
+        raise IncompleteDownload(f"got {size} bytes of {expected}")
+    digest = file_hash(part)
+    if sha256 is not None and digest != sha256:
+        _discard(part)
+        raise ChecksumError(f"sha256 of {url} is {digest}, expected {sha256}")
+    os.replace(part, path)
+    _discard(part)
+    return FileInfo(
+        url=url,
+        size=size,
+        sha256=digest,
+        etag=r.headers.get("ETag"),
+        last_modified=r.headers.get("Last-Modified"),
+        fetched_at=now(),
+        checked_at=now(),
+    )
+
+
+def transfer(
+    client: httpx.Client,
+    url: str,
+    path: str,
+    sha256: Optional[str] = None,
+    previous: Optional[FileInfo] = None,
+) -> Optional[FileInfo]:
+    """Make one attempt to download *url* to *path*, resume partial file if any.
+    Return None if file did not change since *previous* download.
+    """
+    part = part_path(path)
+    offset, validator = _resume(part)
+    headers = _headers(offset, validator, path, previous)
+    with client.stream("GET", url, headers=headers) as r:
+        if r.status_code == 304:
+            return None
+        _check_response(r, part)
+        with _open_part(part, r) as f:
+            for chunk in r.iter_bytes():
+                f.write(chunk)
+    return _finish(part, path, r, offset, sha256)
+
+
+async def atransfer(
+    client: httpx.AsyncClient,
+    url: str,
+    path: str,
+    sha256: Optional[str] = None,
+    previous: Optional[FileInfo] = None,
+) -> Optional[FileInfo]:
+    """Async version of transfer(). File writes and checksum run
+    in a thread, so that they do not block the event loop.
+    """
+    part = part_path(path)
+    offset, validator = await asyncio.to_thread(_resume, part)
+    headers = _headers(offset, validator, path, previous)
+    async with client.stream("GET", url, headers=headers) as r:
+        if r.status_code == 304:
+            return None
+        _check_response(r, part)
+        f = await asyncio.to_thread(_open_part, part, r)
+        try:
+            async for chunk in r.aiter_bytes():
+                await asyncio.to_thread(f.write, chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+    return await asyncio.to_thread(_finish, part, path, r, offset, sha256)
+
+
+def fetch_file(
+    path: str,
+    url: str,
+    retries: int = 3,
+    backoff: float = 1.0,
+    timeout: float = 60.0,
+    sha256: Optional[str] = None,
+    previous: Optional[FileInfo] = None,
+) -> Optional[FileInfo]:
+    """Download *url* to *path*, resume after broken transfers.
+
+    *path* is created only when the whole file is received, and its
+    sha256 digest matches *sha256*, if given.
+
+    If *previous* download of existing *path* is given, send a conditional
+    request and return None if file on server did not change.
+    """
+    with httpx.Client(timeout=timeout, follow_redirects=True) as client:
+        for attempt in range(1, retries + 2):
+            try:
+                return transfer(client, url, path, sha256, previous)
+            except (RetryableError, httpx.TransportError):
+                if attempt > retries:
+                    raise
+                time.sleep(backoff_delay(attempt, backoff))
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
+async def afetch_file(
+    path: str,
+    url: str,
+    retries: int = 3,
+    backoff: float = 1.0,
+    timeout: float = 60.0,
+    sha256: Optional[str] = None,
+    previous: Optional[FileInfo] = None,
+    client: Optional[httpx.AsyncClient] = None,
+) -> Optional[FileInfo]:
+    """Async version of fetch_file(), uses *client* if given."""
+    if client is None:
+        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as c:
+            return await afetch_file(
+                path, url, retries, backoff, timeout, sha256, previous, c
+            )
+    for attempt in range(1, retries + 2):
+        try:
+            return await atransfer(client, url, path, sha256, previous)
+        except (RetryableError, httpx.TransportError):
+            if attempt > retries:
+                raise
+            await asyncio.sleep(backoff_delay(attempt, backoff))
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
+def _previous(manifest: Manifest, path: str) -> Optional[FileInfo]:
+    """Recorded download of *path*, if the file is present and intact."""
+    if os.path.exists(path) and manifest.is_intact(path):
+        return manifest.get(path)
+    return None
+
+
+def _record(
+    manifest: Manifest, path: str, info: Optional[FileInfo], previous
+) -> FileInfo:
+    if info is None:
+        info = previous
+        info.checked_at = now()
+    manifest.update(path, info)
+    return info
+
+
+# manifest updates from threads of async code
+_manifest_lock = threading.Lock()
+
+
+def _record_locked(
+    manifest: Optional[Manifest], path: str, info: Optional[FileInfo], previous
+) -> FileInfo:
+    """Same as _record(), safe to call from several threads. If *manifest*
+    is None, it is read from file, so records made by others are kept.
+    """
+    with _manifest_lock:
+        return _record(manifest or Manifest.of(path), path, info, previous)
+
+
+def update_file(path: str, url: str, **kwargs) -> bool:
+    """Download *url* to *path*, or, if *path* was downloaded before,
+    download it again only if it changed on server.
+
+    Downloads are recorded in manifest file in *path* directory.
+    Return True if file was downloaded, False if it did not change.
+    """
+    manifest = Manifest.of(path)
+    previous = _previous(manifest, path)
+    info = fetch_file(path, url, previous=previous, **kwargs)
+    _record(manifest, path, info, previous)
+    return info is not None
+
+
+async def aupdate_file(path: str, url: str, **kwargs) -> bool:
+    """Async version of update_file()."""
+    manifest = await asyncio.to_thread(Manifest.of, path)
+    previous = _previous(manifest, path)
+    info = await afetch_file(path, url, previous=previous, **kwargs)
+    await asyncio.to_thread(_record_locked, None, path, info, previous)
+    return info is not None
+
+
+async def _download_one(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    d: Date,
+    directory: str,
+    make_url: Callable[[Date], str],
+    retries: int,
+    backoff: float,
+    manifest: Manifest,
+    refresh: bool,
+) -> DownloadResult:
+    path = locate(d, directory=directory)
+    result = DownloadResult(d.year, d.release, path, make_url(d), status="failed")
+    if os.path.exists(path) and manifest.is_intact(path) and not refresh:
+        result.status = "exists"
+        result.size = os.path.getsize(path)
+        return result
+    previous = _previous(manifest, path)
+    start = time.perf_counter()
+    async with semaphore:
+        for attempt in range(1, retries + 2):
+            result.attempts = attempt
+            try:
+                info = await atransfer(client, result.url, path, previous=previous)
+                result.status = "downloaded" if info else "not modified"
+                # manifest is read again, to keep records made by others
+                record = await asyncio.to_thread(
+                    _record_locked, None, path, info, previous
+                )
+                result.size = record.size
+                result.error = None
+                break
+            except (RetryableError, httpx.TransportError) as e:
+                result.error = f"{type(e).__name__}: {e}"
+                if attempt <= retries:
+                    await asyncio.sleep(backoff_delay(attempt, backoff))
+            except httpx.HTTPStatusError as e:
+                result.error = f"HTTP {e.response.status_code}"
+                break
+            except Exception as e:
+                # e.g. too many redirects or disk full: this file failed,
+                # results for other files are still returned
+                result.error = f"{type(e).__name__}: {e}"
+                break
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+async def adownload_many(
+    releases: Optional[Iterable[Tuple[int, Union[int, str]]]] = None,
+    directory: str = ".",
+    max_concurrency: int = 4,
+    timeout: float = 60.0,
+    retries: int = 3,
+    backoff: float = 1.0,
+    client: Optional[httpx.AsyncClient] = None,
+    make_url: Callable[[Date], str] = make_url_countries,
+    refresh: bool = False,
+) -> List[DownloadResult]:
+    """Download *releases* to *directory*, at most *max_concurrency* files
+    at a time. See download_many() for parameters.
+    """
+    if releases is None:
+        releases = all_releases()
+    dates = [get_date(year, release) for (year, release) in releases]
+    semaphore = asyncio.Semaphore(max_concurrency)
+    manifest = Manifest(directory)
+    own_client = client is None
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_concurrency),
+        )
+    try:
+        return await asyncio.gather(
+            *[
+                _download_one(
+                    client,
+                    semaphore,
+                    d,
+                    directory,
+                    make_url,
+                    retries,
+                    backoff,
+                    manifest,
+                    refresh,
+                )
+                for d in dates
+            ]
+        )
+    finally:
+        if own_client:
+            await client.aclose()
+
+
+def download_many(
+    releases: Optional[Iterable[Tuple[int, Union[int, str]]]] = None,
+    directory: str = ".",
+    max_concurrency: int = 4,
+    timeout: float = 60.0,
+    retries: int = 3,
+    backoff: float = 1.0,
+    make_url: Callable[[Date], str] = make_url_countries,
+    refresh: bool = False,
+) -> List[DownloadResult]:
+    """Download several WEO releases concurrently.
+
+      from weo import all_releases, download_many
+      results = download_many(all_releases(), directory="weo_data")
+      failed = [r for r in results if not r.ok]
+
+    Files already present in *directory* are not downloaded again,
+    unless *refresh* is True. Downloads are recorded in manifest file
+    (see weo.manifest), with *refresh* files downloaded before are
+    requested again only if they changed on server.
+
+    Parameters
+    ----------
+    releases : list of (year, release) pairs
+        Releases to download, all releases by default.
+    directory : str
+        Directory where to write files, must exist.
+    max_concurrency : int
+        Number of files downloaded at the same time.
+    timeout : float
+        Timeout in seconds for connecting and for reading each chunk of data.
+    retries : int
+        Number of times to repeat failed request.
+    backoff : float
+        Delay before first retry in seconds, doubled for each next retry.
+    refresh : bool
+        Check files already present in *directory* for updates.
+    make_url: callable, optional
+        Used for testing.
+
+    Returns
+    -------
+    list of DownloadResult, in same order as *releases*
+    """
+    return asyncio.run(
+        adownload_many(
+            releases,
+            directory=directory,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+            make_url=make_url,
+            refresh=refresh,
+        )
+    )
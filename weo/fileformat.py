@@ -0,0 +1,142 @@
+"""Detect encoding and layout of WEO file without parsing it.
+
+  from weo.fileformat import sniff
+  fmt = sniff('weo.csv')
+  # FileFormat(encoding='utf-16-le', delimiter='\\t', bom=2, footer=...)
+
+Files released before October 2020 are ISO-8859-1 text,
+later files are UTF-16 LE. Both are tab-separated and end with
+a footnote like "International Monetary Fund, World Economic
+Outlook Database, October 2019".
+"""
+
+import codecs
+import csv
+import hashlib
+import io
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Set, Tuple, Union
+
+__all__ = ["FileFormat", "sniff", "file_hash"]
+
+FOOTNOTE_START = "International Monetary Fund"
+
+# Missing values in year columns, "n/a" is also a pandas default.
+NA_VALUES = ["n/a", "--"]
+
+# bytes to read from file start and end
+HEAD_SIZE = 4096
+TAIL_SIZE = 4096
+
+BOMS = [
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+]
+
+
+def char_size(encoding: str) -> int:
+    return 2 if encoding.startswith("utf-16") else 1
+
+
+@dataclass(frozen=True)
+class FileFormat:
+    """Encoding, delimiter and footer position of WEO file.
+
+    *bom* is the length of byte order mark in bytes, *footer* is
+    byte offset of the footnote line, None if footnote was not found.
+    """
+
+    encoding: str
+    delimiter: str = "\t"
+    bom: int = 0
+    footer: Optional[int] = None
+
+    def read_footer(self, filename: str) -> str:
+        """Return footnote text of *filename*."""
+        if self.footer is None:
+            raise ValueError(f"No footnote found in {filename}")
+        with open(filename, "rb") as f:
+            f.seek(self.footer)
+            return f.read().decode(self.encoding).strip()
+
+    def read_header(self, filename: str) -> List[str]:
+        """Return column names of *filename*."""
+        with open(filename, "rb") as f:
+            f.seek(self.bom)
+            text = io.TextIOWrapper(f, encoding=self.encoding, newline="")
+            return next(csv.reader(text, delimiter=self.delimiter))
+
+
+def detect_encoding(head: bytes) -> Tuple[str, int]:
+    """Return encoding and byte order mark length for file starting with *head*."""
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding, len(bom)
+    # UTF-16 without byte order mark has every other byte zero in ASCII text
+    if len(head) >= 4:
+        if head[1] == 0 and head[3] == 0 and head[0] != 0:
+            return "utf-16-le", 0
+        if head[0] == 0 and head[2] == 0 and head[1] != 0:
+            return "utf-16-be", 0
+    return "iso-8859-1", 0
+
+
+def detect_delimiter(header: str) -> str:
+    return "\t" if header.count("\t") >= header.count(",") else ","
+
+
+def find_footer(tail: bytes, offset: int, encoding: str, bom: int = 0):
+    """Return byte offset of the footnote in file, given file *tail*
+    that starts at *offset*. Return None if there is no footnote.
+    """
+    needle = FOOTNOTE_START.encode(encoding)
+    i = tail.rfind(needle)
+    # match must start at character boundary
+    while i != -1 and (offset + i - bom) % char_size(encoding):
+        i = tail.rfind(needle, 0, i + len(needle) - 1)
+    if i == -1:
+        return None
+    return offset + i
+
+
+def sniff(filename: str) -> FileFormat:
+    """Detect encoding, delimiter and footer position of *filename*
+    by reading its first and last bytes.
+    """
+    with open(filename, "rb") as f:
+        head = f.read(HEAD_SIZE)
+        encoding, bom = detect_encoding(head)
+        f.seek(0, 2)
+        offset = max(bom, f.tell() - TAIL_SIZE)
+        f.seek(offset)
+        tail = f.read()
+    n = len(head) - (len(head) - bom) % char_size(encoding)
+    header = head[bom:n].decode(encoding, errors="replace").split("\n")[0]
+    return FileFormat(
+        encoding=encoding,
+        delimiter=detect_delimiter(header),
+        bom=bom,
+        footer=find_footer(tail, offset, encoding, bom),
+    )
+
+
+def file_hash(filename: str, chunk_size: int = 2**20) -> str:
+    """Return sha256 hex digest of *filename* content."""
+    h = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+Labels = Optional[Iterable[Union[str, int]]]
+
+
+def as_labels(xs: Labels) -> Optional[Set[str]]:
+    """Make a set of strings from filter argument, None means no filter."""
+    if xs is None:
+        return None
+    if isinstance(xs, (str, int)):
+        xs = [xs]
+    return {str(x) for x in xs}
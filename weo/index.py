@@ -0,0 +1,95 @@
+"""Row positions of WEO dataframe by subject code, country and subject/unit.
+
+  ix = RowIndex(w.df)
+  ix.code["NGDPD"]      # positions of NGDPD rows for all countries
+  ix.grid[ix.codes.get_loc("NGDPD"), ix.isos.get_loc("DEU")]  # one row
+
+Built once per WEO, a lookup is a dictionary access and does not scan
+the dataframe. Use positions with df.iloc[] or numpy arrays.
+"""
+
+import sys
+from functools import cached_property
+from typing import Dict
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+__all__ = ["RowIndex", "positions"]
+
+EMPTY = np.array([], dtype=np.intp)
+
+
+def _labels(df, column) -> np.ndarray:
+    return df[column].to_numpy(dtype=object)
+
+
+def positions(df, columns) -> Dict:
+    """Map values of *columns* in *df* to arrays of row positions."""
+    # grouping by object arrays is faster than by categoricals
+    names = [columns] if isinstance(columns, str) else columns
+    keys = pd.DataFrame({c: _labels(df, c) for c in names})
+    return keys.groupby(columns, sort=False).indices
+
+
+class RowIndex:
+    def __init__(self, df):
+        self.code = positions(df, "WEO Subject Code")
+        self.iso = positions(df, "ISO")
+        self.subject_unit = positions(df, ["Subject Descriptor", "Units"])
+        # position of row's code and country in sorted lists of codes and countries,
+        # as object arrays, because categoricals are sorted in order of categories
+        self.code_pos, codes = pd.factorize(_labels(df, "WEO Subject Code"), sort=True)
+        self.iso_pos, isos = pd.factorize(_labels(df, "ISO"), sort=True)
+        self.codes, self.isos = pd.Index(codes), pd.Index(isos)
+
+    @cached_property
+    def alpha2(self) -> Dict:
+        """Map two-letter country codes to positions, same codes as
+        in weo.countries (XK for Kosovo, PS for West Bank and Gaza).
+        """
+        from .countries import alpha2
+
+        result = {}
+        for iso, rows in self.iso.items():
+            code = alpha2(iso)
+            if code:
+                result[code] = rows
+        return result
+
+    @cached_property
+    def grid(self) -> np.ndarray:
+        """Row position by code and country, in order of .codes and .isos,
+        -1 where there is no row. First row is kept for duplicates.
+        """
+        grid = np.full((len(self.codes), len(self.isos)), -1, dtype=np.intp)
+        ix = (self.code_pos >= 0) & (self.iso_pos >= 0)
+        # later assignment wins, so assign rows in reverse order
+        rows = np.flatnonzero(ix)[::-1]
+        grid[self.code_pos[rows], self.iso_pos[rows]] = rows
+        return grid
+
+    def isos_of(self, codes) -> np.ndarray:
+        """Countries that have rows for *codes*, in order of first row."""
+        rows = np.sort(np.concatenate([EMPTY] + [self.by_code(c) for c in codes]))
+        pos = self.iso_pos[rows]
+        return pd.unique(self.isos.to_numpy()[pos[pos >= 0]])
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by index."""
+        size = self.code_pos.nbytes + self.iso_pos.nbytes
+        for d in (self.code, self.iso, self.subject_unit):
+            size += sys.getsizeof(d) + sum(v.nbytes for v in d.values())
+        return size
+
+    def by_code(self, code: str):
+        return self.code.get(code, EMPTY)
+
+    def by_iso(self, iso_code: str):
+        if len(iso_code) == 2:
+            return self.alpha2.get(iso_code, EMPTY)
+        return self.iso.get(iso_code, EMPTY)
+
+    def by_subject_and_unit(self, subject: str, unit: str):
+        return self.subject_unit.get((subject, unit), EMPTY)
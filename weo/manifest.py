@@ -0,0 +1,96 @@
+"""Record of downloaded files kept in each data directory.
+
+  weo_data/weo_manifest.json
+
+  {"files": {"weo_2019_2.csv": {"url": ..., "size": ..., "sha256": ...,
+                                "etag": ..., "last_modified": ...,
+                                "fetched_at": ..., "checked_at": ...}}}
+
+ETag and Last-Modified headers allow to ask IMF server whether the file
+changed since it was downloaded (a conditional request), size allows
+to notice a damaged local file.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+__all__ = ["Manifest", "FileInfo"]
+
+FILENAME = "weo_manifest.json"
+
+
+def now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass
+class FileInfo:
+    """Downloaded file properties."""
+
+    url: str
+    size: int
+    sha256: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: Optional[str] = None
+    checked_at: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers to ask server for the file only if it changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class Manifest:
+    """Manifest of *directory*, saved on each update."""
+
+    def __init__(self, directory: str = "."):
+        self.path = os.path.join(directory, FILENAME)
+        self.files: Dict[str, FileInfo] = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                content = json.load(f)
+            known = {f.name for f in fields(FileInfo)}
+            for name, entry in content.get("files", {}).items():
+                entry = {k: v for k, v in entry.items() if k in known}
+                self.files[name] = FileInfo(**entry)
+
+    @classmethod
+    def of(cls, path: str) -> "Manifest":
+        """Manifest of directory where *path* is located."""
+        return cls(os.path.dirname(path) or ".")
+
+    def get(self, path: str) -> Optional[FileInfo]:
+        return self.files.get(os.path.basename(path))
+
+    def is_intact(self, path: str) -> bool:
+        """False if *path* size differs from recorded size, True otherwise."""
+        info = self.get(path)
+        return info is None or info.size == os.path.getsize(path)
+
+    def update(self, path: str, info: FileInfo):
+        self.files[os.path.basename(path)] = info
+        self.save()
+
+    def save(self):
+        content = {"files": {k: asdict(v) for k, v in sorted(self.files.items())}}
+        # unique temporary name, so that processes saving same manifest
+        # do not write to the same file
+        directory, name = os.path.split(self.path)
+        fd, tmp = tempfile.mkstemp(dir=directory or ".", prefix=name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(content, f, indent=2)
+            os.replace(tmp, self.path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
@@ -0,0 +1,127 @@
+"""Keep results of WEO accessors for repeated calls.
+
+  w = WEO("weo.csv", memo=256)
+  w.gdp_usd(2020)            # computed
+  w.gdp_usd(year="2020")     # same arguments, from memo
+  w.cache_info()             # CacheInfo(hits=1, misses=1, maxsize=256, currsize=1)
+  w.cache_clear()
+
+Arguments are normalized before lookup: 2020 and "2020" are the same year,
+a list and a tuple of the same codes are the same argument. Dataframes and
+series in memo hold read-only arrays, each call returns a shallow copy:
+new columns or labels in a result do not change the memo, assigning to
+values in place raises ValueError. Results with several types of columns
+are copied on each call.
+"""
+
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+__all__ = ["CacheInfo", "Memo", "memoize"]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def normalize(x) -> Hashable:
+    """Make argument *x* hashable, years as strings."""
+    if isinstance(x, (bool, np.bool_)) or x is None:
+        return x
+    if isinstance(x, (int, np.integer)):
+        return str(x)
+    if isinstance(x, (set, frozenset)):
+        return tuple(sorted(normalize(i) for i in x))
+    if isinstance(x, (list, tuple, range, np.ndarray, pd.Index)):
+        return tuple(normalize(i) for i in x)
+    return x
+
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    values = np.array(values, copy=True)
+    values.flags.writeable = False
+    return values
+
+
+def freeze(result):
+    """Return (value to keep, whether shallow copy of it is safe to return)."""
+    if isinstance(result, pd.DataFrame):
+        dtypes = set(result.dtypes)
+        if len(dtypes) == 1 and isinstance(dtypes.pop(), np.dtype):
+            values = _read_only(result.to_numpy())
+            return pd.DataFrame(values, result.index, result.columns, copy=False), True
+    elif isinstance(result, pd.Series):
+        if isinstance(result.dtype, np.dtype):
+            values = _read_only(result.to_numpy())
+            return pd.Series(values, result.index, name=result.name, copy=False), True
+    elif isinstance(result, list):
+        return tuple(result), True
+    return result, False
+
+
+def thaw(value, shallow: bool):
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=not shallow)
+    return value
+
+
+class Memo:
+    """Least recently used results, at most *maxsize* of them."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._results: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key: Hashable, compute: Callable):
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+        if entry is None:
+            entry = freeze(compute())
+            with self._lock:
+                self.misses += 1
+                self._results[key] = entry
+                while len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+        return thaw(*entry)
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    def cache_clear(self):
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = 0
+
+
+def memoize(method):
+    """Keep results of WEO *method* in .memo, if memo is enabled."""
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def inner(self, *args, **kwargs):
+        if self.memo is None:
+            return method(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = list(bound.arguments.values())[1:]
+        key = (method.__name__, *map(normalize, arguments))
+        return self.memo.get(key, lambda: method(self, *args, **kwargs))
+
+    return inner
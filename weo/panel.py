@@ -0,0 +1,184 @@
+"""Many WEO releases (vintages) as one array.
+
+  from weo.panel import WEOPanel
+  p = WEOPanel.from_directory("weo_data")
+  p.series("NGDP_RPCH", "DEU")   # vintage x year dataframe
+  p.cross_section("NGDP_RPCH", 2020)  # vintage x country dataframe
+
+Values are held in a float array of shape (vintage, code, country, year).
+Codes, countries and years are shared axes, a union of those found in
+every release. Missing values are NaN.
+"""
+
+import os
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from .dataframe import WEO
+from .dates import Date, all_releases, get_date, locate, month
+
+__all__ = ["WEOPanel", "Block"]
+
+Release = Tuple[int, int]
+
+
+class Block(NamedTuple):
+    """Numeric part of one WEO release with labels for each row."""
+
+    codes: np.ndarray
+    isos: np.ndarray
+    years: List[str]
+    values: np.ndarray
+    # code -> (subject, unit)
+    subjects: Dict[str, Tuple[str, str]]
+
+    @classmethod
+    def from_weo(cls, w: WEO) -> "Block":
+        return cls(
+            # copies do not keep the whole dataframe in memory
+            codes=w.df["WEO Subject Code"].to_numpy(dtype=object, copy=True),
+            isos=w.df["ISO"].to_numpy(dtype=object, copy=True),
+            years=w.years,
+            values=w.values,
+            subjects=dict(w.catalog.subject_unit_by_code),
+        )
+
+
+def vintage_period(release: Release) -> pd.Period:
+    d = Date(*release)
+    return pd.Period(year=d.year, month=month(d), freq="M")
+
+
+def _union(blocks: Iterable[Block], attr: str) -> pd.Index:
+    labels = set()
+    for block in blocks:
+        labels.update(x for x in getattr(block, attr) if isinstance(x, str))
+    return pd.Index(sorted(labels))
+
+
+class WEOPanel:
+    """Values of several WEO releases in (vintage, code, country, year) array.
+
+    Use from_directory(), from_files() or from_weos() to create.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        releases: List[Release],
+        codes: pd.Index,
+        isos: pd.Index,
+        years: pd.Index,
+        subjects: Optional[Dict[str, Tuple[str, str]]] = None,
+    ):
+        self.values = values
+        self.releases = releases
+        self.vintages = pd.PeriodIndex(
+            [vintage_period(r) for r in releases], name="vintage"
+        )
+        self.codes = codes.rename("WEO Subject Code")
+        self.isos = isos.rename("ISO")
+        self.years = years.rename("year")
+        self.subjects = subjects or {}
+
+    @classmethod
+    def from_blocks(cls, blocks: Dict[Release, Block], dtype=np.float64) -> "WEOPanel":
+        """Combine *blocks* of several releases into one array."""
+        releases = sorted(blocks.keys())
+        ordered = [blocks[r] for r in releases]
+        codes = _union(ordered, "codes")
+        isos = _union(ordered, "isos")
+        years = pd.Index(sorted({y for b in ordered for y in b.years}, key=int))
+        values = np.full(
+            (len(releases), len(codes), len(isos), len(years)), np.nan, dtype=dtype
+        )
+        subjects: Dict[str, Tuple[str, str]] = {}
+        for v, block in enumerate(ordered):
+            ci = codes.get_indexer(block.codes)
+            ki = isos.get_indexer(block.isos)
+            yi = years.get_indexer(block.years)
+            rows = (ci >= 0) & (ki >= 0)
+            values[v, ci[rows, None], ki[rows, None], yi[None, :]] = block.values[rows]
+            subjects.update(block.subjects)  # latest release wins
+        values.flags.writeable = False
+        return cls(values, releases, codes, isos, years, subjects)
+
+    @classmethod
+    def from_weos(cls, weos: Dict[Release, WEO], dtype=np.float64) -> "WEOPanel":
+        return cls.from_blocks(
+            {r: Block.from_weo(w) for r, w in weos.items()}, dtype=dtype
+        )
+
+    @classmethod
+    def from_files(
+        cls, paths: Dict[Release, str], dtype=np.float64, **subset
+    ) -> "WEOPanel":
+        """Read files in *paths*, a dictionary like {(2019, 2): "weo_2019_2.csv"}.
+
+        Files are read one by one, only numeric part of each file is kept
+        until the array is created. Use *subset* keywords (codes, countries,
+        years) to read part of each file, see WEO().
+        """
+        blocks = {r: Block.from_weo(WEO(path, **subset)) for r, path in paths.items()}
+        return cls.from_blocks(blocks, dtype=dtype)
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: str = ".",
+        releases: Optional[Iterable[Tuple[int, Union[int, str]]]] = None,
+        dtype=np.float64,
+        **subset,
+    ) -> "WEOPanel":
+        """Read files saved by download() to *directory*,
+        missing files are skipped.
+        """
+        if releases is None:
+            releases = all_releases()
+        paths = {}
+        for year, release in releases:
+            d = get_date(year, release)
+            path = locate(d, directory=directory)
+            if os.path.exists(path):
+                paths[(d.year, d.release)] = path
+        return cls.from_files(paths, dtype=dtype, **subset)
+
+    def __repr__(self):
+        v, c, k, y = self.values.shape
+        return (
+            f"<WEOPanel: {v} vintages, {c} codes, {k} countries, {y} years, "
+            f"{self.nbytes / 2**20:.1f}Mb>"
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes
+
+    def _position(self, labels: pd.Index, label, name: str) -> int:
+        try:
+            return labels.get_loc(label)
+        except KeyError:
+            raise KeyError(f"{name} not found: {label}")
+
+    def series(self, code: str, iso_code: str) -> pd.DataFrame:
+        """Return vintage x year dataframe for variable *code* and country."""
+        c = self._position(self.codes, code, "code")
+        k = self._position(self.isos, iso_code, "country")
+        return pd.DataFrame(
+            self.values[:, c, k, :], index=self.vintages, columns=self.years
+        )
+
+    def cross_section(self, code: str, year: int) -> pd.DataFrame:
+        """Return vintage x country dataframe for variable *code* in *year*."""
+        c = self._position(self.codes, code, "code")
+        y = self._position(self.years, str(year), "year")
+        return pd.DataFrame(
+            self.values[:, c, :, y], index=self.vintages, columns=self.isos
+        )
+
+    def vintage(self, year: int, release: Union[int, str]) -> np.ndarray:
+        """Return code x country x year array for one release."""
+        d = get_date(year, release)
+        return self.values[self.releases.index((d.year, d.release))]
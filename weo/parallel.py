@@ -0,0 +1,133 @@
+"""Read many WEO files in parallel processes.
+
+  import weo
+  weos = weo.load_many(weo.all_releases(), directory="weo_data", workers=4)
+  weos[(2024, 1)].getc("NGDP_RPCH")
+
+  panel = weo.load_many({(2019, 2): "a.csv", (2024, 1): "b.csv"}, panel=True)
+
+Each file is parsed in a worker process, that sends back only numeric
+arrays: values, and metadata columns as integer codes with a list of
+categories (see weo.shared.pack). The parent process rebuilds WEO objects
+from these arrays, or combines them into WEOPanel with panel=True.
+As with weo.shared.attach(), metadata columns of rebuilt WEO are categoricals.
+Files are independent, so loading time goes down with number of cores.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Mapping, Optional, Union
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from .dataframe import WEO, version
+from .dates import get_date, locate
+from .panel import Block, WEOPanel
+from .shared import _encode, pack, unpack
+
+__all__ = ["load_many"]
+
+
+def _paths(sources, directory: Optional[str]) -> Dict:
+    """Return {key: path} for dictionary of paths, list of paths
+    or list of (year, release) pairs.
+    """
+    if isinstance(sources, Mapping):
+        return dict(sources)
+    paths = {}
+    for source in sources:
+        if isinstance(source, (str, os.PathLike)):
+            paths[source] = source
+        else:
+            d = get_date(*source)
+            path = locate(d, directory=directory)
+            if os.path.exists(path):
+                paths[(d.year, d.release)] = path
+    return paths
+
+
+def _parse(path, kwargs):
+    return pack(WEO(path, **kwargs))
+
+
+def _parse_block(path, kwargs):
+    """Return Block fields with codes and ISO labels as integer codes."""
+    block = Block.from_weo(WEO(path, **kwargs))
+    codes = _encode(pd.Series(block.codes, dtype=object))
+    isos = _encode(pd.Series(block.isos, dtype=object))
+    return codes, isos, block.years, block.values, block.subjects
+
+
+def _decode(codes: np.ndarray, categories) -> np.ndarray:
+    # code -1 (missing label) takes last element, None
+    return np.array(list(categories) + [None], dtype=object)[codes]
+
+
+def _block(result) -> Block:
+    codes, isos, years, values, subjects = result
+    return Block(_decode(*codes), _decode(*isos), years, values, subjects)
+
+
+def _release(key, path):
+    """Return (year, release) for *key*, from footnote of *path* if *key*
+    is not a (year, release) pair.
+    """
+    if isinstance(key, tuple):
+        return key
+    try:
+        d = get_date(*version(path))
+    except ValueError:
+        raise ValueError(
+            f"Cannot find release of {path}, use dictionary like "
+            "{(2019, 2): path} with panel=True"
+        )
+    return (d.year, d.release)
+
+
+def load_many(
+    sources: Union[Mapping, Iterable],
+    directory: Optional[str] = None,
+    workers: Optional[int] = None,
+    panel: bool = False,
+    **kwargs,
+):
+    """Read WEO files in parallel.
+
+    Parameters
+    ----------
+    sources : dict or iterable
+        Dictionary like {(2019, 2): "weo_2019_2.csv"}, list of paths
+        or list of (year, release) pairs.
+    directory : str
+        Folder with files saved by download(), used for (year, release)
+        pairs. Missing files are skipped.
+    workers : int
+        Number of processes, number of cores by default. Use workers=1
+        to read files in current process.
+    panel : bool
+        Return WEOPanel instead of dictionary of WEO objects. Release of
+        a file given by path is read from footnote of the file.
+    kwargs
+        Passed to WEO(), for example codes, countries, years, memory.
+
+    Returns
+    -------
+    dict of WEO with same keys as *sources*, or WEOPanel.
+    """
+    paths = _paths(sources, directory)
+    if panel:
+        paths = {_release(key, path): path for key, path in paths.items()}
+    parse = _parse_block if panel else _parse
+    if workers == 1 or len(paths) <= 1:
+        results = [parse(path, kwargs) for path in paths.values()]
+    else:
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(parse, path, kwargs) for path in paths.values()]
+            results = [f.result() for f in futures]
+    if panel:
+        return WEOPanel.from_blocks(
+            {key: _block(result) for key, result in zip(paths, results)}
+        )
+    return {key: unpack(*result) for key, result in zip(paths, results)}
@@ -0,0 +1,198 @@
+"""Keep parsed WEO releases in memory and share them within a process.
+
+  import weo
+  w = weo.get(2024, 1)          # parsed on first call
+  w = weo.get(2024, 1)          # same object, from memory
+  weo.registry.default.info()
+  # RegistryInfo(hits=1, misses=1, evictions=0, items=1, nbytes=..., max_bytes=...)
+
+  from weo.registry import Registry
+  r = Registry(max_bytes=500 * 2**20)
+  w = r.load("weo_data/weo_2024_1.csv", memory="compact")
+
+Entries are keyed by file path, modification time and size of the file,
+and WEO() arguments, so a file changed on disk is parsed again. When
+total size of entries is above *max_bytes*, least recently used entries
+are dropped. Size of entry is WEO.memory_usage() after loading.
+
+Registry is safe to use from many threads: while one thread parses
+a file, other threads that ask for it wait and get the same object.
+WEO objects are shared, so arrays of their .df are made read-only:
+assigning to values of w.df raises ValueError. Use w.df.copy() to get
+a dataframe you can change.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from .dataframe import WEO, as_labels, year_columns
+from .dates import accept, download
+
+__all__ = ["Registry", "RegistryInfo", "default"]
+
+MAX_BYTES = 2**30
+
+# WEO() arguments that may be given as any iterable
+LABELS = ("codes", "countries", "years")
+
+
+class RegistryInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    items: int
+    nbytes: int
+    max_bytes: Optional[int]
+
+
+def _freeze(kwargs: Dict) -> Tuple:
+    items = []
+    for k, v in sorted(kwargs.items()):
+        if k in LABELS and v is not None:
+            v = tuple(sorted(as_labels(v)))
+        items.append((k, v))
+    return tuple(items)
+
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    values = values.view()
+    values.flags.writeable = False
+    return values
+
+
+def read_only_frame(w: WEO) -> pd.DataFrame:
+    """Return w.df with read-only arrays, arrays are not copied.
+
+    Year columns are views of w.values if they are of same type.
+    Columns are not consolidated, as pandas would copy them to new
+    writable blocks.
+    """
+    df = w.df
+    years = year_columns(df)
+    shared = all(df[y].dtype == w.values.dtype for y in years)
+    columns = {}
+    for column in df.columns:
+        s = df[column]
+        if column in years and shared:
+            columns[column] = w.values[:, years.index(column)]
+        elif isinstance(s.dtype, pd.CategoricalDtype):
+            codes = _read_only(s.cat.codes.to_numpy())
+            columns[column] = pd.Categorical.from_codes(codes, dtype=s.dtype)
+        elif isinstance(s.dtype, np.dtype):
+            columns[column] = _read_only(s.to_numpy())
+        else:
+            columns[column] = s.array
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+class Registry:
+    """Least recently used WEO objects, up to *max_bytes* in total
+    (no limit if None).
+    """
+
+    def __init__(self, max_bytes: Optional[int] = MAX_BYTES):
+        self.max_bytes = max_bytes
+        # key -> (WEO, bytes), least recently used first
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: Dict[Tuple, threading.Lock] = {}
+        self.hits = self.misses = self.evictions = 0
+
+    def _key(self, path: str, kwargs: Dict) -> Tuple:
+        stat = os.stat(path)
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, _freeze(kwargs))
+
+    def _lookup(self, key) -> Optional[WEO]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def load(self, path: str, **kwargs) -> WEO:
+        """Return WEO(path, **kwargs), parse file if it is not in registry."""
+        key = self._key(path, kwargs)
+        with self._lock:
+            w = self._lookup(key)
+            if w is not None:
+                return w
+            loading = self._loading.setdefault(key, threading.Lock())
+        with loading:
+            with self._lock:
+                # parsed by other thread while we waited
+                w = self._lookup(key)
+                if w is not None:
+                    return w
+                self.misses += 1
+            try:
+                w = WEO(path, **kwargs)
+                w.df = read_only_frame(w)
+                self._store(key, w)
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+        return w
+
+    def _store(self, key, w: WEO):
+        nbytes = int(w.memory_usage().sum())
+        with self._lock:
+            # previous versions of same file
+            for old in [
+                k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]
+            ]:
+                del self._entries[old]
+                self.evictions += 1
+            self._entries[key] = (w, nbytes)
+            # the newest entry is kept even if it is above the limit
+            while self.max_bytes is not None and len(self._entries) > 1:
+                if self.nbytes <= self.max_bytes:
+                    break
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get(
+        self,
+        year: int,
+        release: Union[int, str],
+        path: Optional[str] = None,
+        directory: Optional[str] = None,
+        **kwargs,
+    ) -> WEO:
+        """Return WEO for release, download file if not present.
+        *kwargs* are passed to WEO().
+        """
+        _, path, _ = accept(year, release, path, directory)
+        if not os.path.exists(path):
+            download(year, release, path)
+        return self.load(path, **kwargs)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(n for _, n in self._entries.values())
+
+    def info(self) -> RegistryInfo:
+        with self._lock:
+            return RegistryInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                len(self._entries),
+                self.nbytes,
+                self.max_bytes,
+            )
+
+    def clear(self):
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# used by weo.get()
+default = Registry()
@@ -0,0 +1,159 @@
+"""Revisions between WEO releases and forecast errors.
+
+  from weo.panel import WEOPanel
+  from weo.revisions import revision, revisions, forecast_errors
+
+  p = WEOPanel.from_directory("weo_data")
+  revision(p, (2023, 2), (2024, 1)).tidy()  # code, country, year, value
+  revisions(p, relative=True)               # every next release vs previous
+  forecast_errors(p, horizon=1)             # first estimate less forecast
+                                            # made a year before
+
+Each function computes the result for all codes, countries and years
+at once and returns a Cube: a numpy array with labels for its axes.
+
+Definitions:
+
+- revision: value in newer release less value in older release,
+  relative revision is this difference divided by absolute older value;
+- first release of year *t* value: value in the release of year *t+1*
+  (April by default);
+- latest value: value in the most recent release that has it;
+- forecast at horizon *h* for year *t*: value in the release of year *t-h*
+  (April by default);
+- forecast error: outcome (first release or latest value) less forecast.
+"""
+
+from typing import Iterable, Optional, Tuple, Union
+
+import numpy as np  # type: ignore
+
+from .cube import Cube
+from .dates import Date
+from .panel import WEOPanel
+
+__all__ = [
+    "Cube",
+    "revision",
+    "revisions",
+    "first_release",
+    "latest",
+    "first_vs_latest",
+    "forecast_errors",
+]
+
+ReleaseLike = Union[Date, Tuple[int, int]]
+
+
+def _key(release: ReleaseLike) -> Tuple[int, int]:
+    if isinstance(release, Date):
+        return (release.year, release.release)
+    return tuple(release)  # type: ignore
+
+
+def _position(panel: WEOPanel, release: ReleaseLike) -> int:
+    try:
+        return panel.releases.index(_key(release))
+    except ValueError:
+        raise KeyError(f"Release not in panel: {release}")
+
+
+def _difference(new, old, relative: bool):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if relative:
+            result = (new - old) / np.abs(old)
+            return np.where(old == 0, np.nan, result)
+        return new - old
+
+
+def _cube(panel: WEOPanel, values) -> Cube:
+    return Cube(values, [panel.codes, panel.isos, panel.years])
+
+
+def revision(
+    panel: WEOPanel, old: ReleaseLike, new: ReleaseLike, relative: bool = False
+) -> Cube:
+    """Revision between releases *old* and *new*, by code, country and year."""
+    a = panel.values[_position(panel, old)]
+    b = panel.values[_position(panel, new)]
+    return _cube(panel, _difference(b, a, relative))
+
+
+def revisions(
+    panel: WEOPanel,
+    releases: Optional[Iterable[ReleaseLike]] = None,
+    relative: bool = False,
+) -> Cube:
+    """Revisions between each pair of consecutive releases, by vintage
+    of newer release, code, country and year.
+
+    Use *releases* to select a chain of releases, for example from
+    weo.dates.yield_dates(), releases not in *panel* are skipped.
+    Default is all releases in *panel*.
+    """
+    if releases is None:
+        ix = list(range(len(panel.releases)))
+    else:
+        keys = [_key(r) for r in releases]
+        ix = [panel.releases.index(k) for k in keys if k in panel.releases]
+    values = panel.values[ix]
+    diff = _difference(values[1:], values[:-1], relative)
+    return Cube(diff, [panel.vintages[ix[1:]], panel.codes, panel.isos, panel.years])
+
+
+def _take_by_year(panel: WEOPanel, shift: int, release: int) -> np.ndarray:
+    """For each year *t* take value of *t* from release of year *t+shift*."""
+    vi, yi = [], []
+    for y, year in enumerate(panel.years):
+        key = (int(year) + shift, release)
+        if key in panel.releases:
+            vi.append(panel.releases.index(key))
+            yi.append(y)
+    shape = panel.values.shape[1:]
+    result = np.full(shape, np.nan, dtype=panel.values.dtype)
+    if vi:
+        # advanced indexing puts selected (vintage, year) pairs first
+        taken = panel.values[np.array(vi), :, :, np.array(yi)]
+        result[:, :, np.array(yi)] = np.moveaxis(taken, 0, -1)
+    return result
+
+
+def first_release(panel: WEOPanel, release: int = 1) -> Cube:
+    """Value of year *t* in the release of year *t+1*."""
+    return _cube(panel, _take_by_year(panel, 1, release))
+
+
+def _latest_values(panel: WEOPanel) -> np.ndarray:
+    values = panel.values
+    available = ~np.isnan(values)
+    # position of last available value along vintage axis
+    last = values.shape[0] - 1 - np.argmax(available[::-1], axis=0)
+    result = np.take_along_axis(values, last[None, ...], axis=0)[0]
+    return np.where(available.any(axis=0), result, np.nan)
+
+
+def latest(panel: WEOPanel) -> Cube:
+    """Value in the most recent release that has it."""
+    return _cube(panel, _latest_values(panel))
+
+
+def first_vs_latest(panel: WEOPanel, release: int = 1, relative=False) -> Cube:
+    """Latest value less first release value."""
+    first = _take_by_year(panel, 1, release)
+    return _cube(panel, _difference(_latest_values(panel), first, relative))
+
+
+def forecast_errors(
+    panel: WEOPanel, horizon: int = 0, release: int = 1, outcome: str = "first"
+) -> Cube:
+    """Outcome less forecast made *horizon* years before, by code,
+    country and year. *outcome* is "first" (first release) or "latest".
+    """
+    forecast = _take_by_year(panel, -horizon, release)
+    if outcome == "first":
+        actual = _take_by_year(panel, 1, release)
+    elif outcome == "latest":
+        actual = _latest_values(panel)
+    else:
+        raise ValueError(f"outcome must be 'first' or 'latest', got {outcome}")
+    return _cube(panel, actual - forecast)
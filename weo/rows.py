@@ -0,0 +1,117 @@
+"""Read WEO file row by row, without loading whole file.
+
+  import weo
+  for row in weo.iter_rows("weo.csv", codes=["NGDP_RPCH"], countries=["DEU"]):
+      print(row.iso, row.code, row.values[-5:])  # values is a float array
+
+Rows are parsed one at a time from a text stream, so memory use does not
+depend on file size. Encoding and delimiter are detected as in read_csv(),
+reading stops at the footnote.
+
+One variable across many releases:
+
+  for year, release in weo.all_releases():
+      path = weo.dates.locate(weo.dates.get_date(year, release), "weo_data")
+      for row in weo.iter_rows(path, codes=["NGDP_RPCH"], countries=["DEU"]):
+          ...
+"""
+
+import csv
+import io
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+import numpy as np  # type: ignore
+
+from .fileformat import NA_VALUES, FileFormat, Labels, as_labels, sniff
+
+__all__ = ["Row", "iter_rows"]
+
+
+class Row(NamedTuple):
+    """One variable for one country from WEO file.
+
+    *years* is the same tuple for all rows of a file,
+    *values* is a float array of same length, NaN for missing values.
+    """
+
+    weo_country_code: str
+    iso: str
+    code: str
+    country: str
+    subject: str
+    units: str
+    scale: str
+    estimates_start_after: Optional[int]
+    years: Tuple[str, ...]
+    values: np.ndarray
+
+
+def to_float(text: str) -> float:
+    text = text.strip()
+    if not text or text in NA_VALUES:
+        return np.nan
+    try:
+        return float(text.replace(",", ""))
+    except ValueError:
+        return np.nan
+
+
+def to_year(text: str) -> Optional[int]:
+    value = to_float(text)
+    return None if np.isnan(value) else int(value)
+
+
+# column name -> Row field
+COLUMNS = {
+    "WEO Country Code": "weo_country_code",
+    "ISO": "iso",
+    "WEO Subject Code": "code",
+    "Country": "country",
+    "Subject Descriptor": "subject",
+    "Units": "units",
+    "Scale": "scale",
+    "Estimates Start After": "estimates_start_after",
+}
+
+
+def iter_rows(
+    filename,
+    codes: Labels = None,
+    countries: Labels = None,
+    fmt: Optional[FileFormat] = None,
+    as_dict: bool = False,
+) -> Iterator:
+    """Yield rows of WEO file as Row named tuples or as dictionaries.
+
+    Use *codes* and *countries* (ISO codes) to yield only some rows,
+    values of other rows are not parsed.
+    """
+    if fmt is None:
+        fmt = sniff(filename)
+    codes, isos = as_labels(codes), as_labels(countries)
+    with open(filename, "rb") as raw:
+        raw.seek(fmt.bom)
+        text = io.TextIOWrapper(raw, encoding=fmt.encoding, newline="")
+        reader = csv.reader(text, delimiter=fmt.delimiter)
+        header = next(reader)
+        position = {name: i for i, name in enumerate(header)}
+        fields = [(position.get(name), field) for name, field in COLUMNS.items()]
+        year_ix = [i for i, name in enumerate(header) if name.isdigit()]
+        years = tuple(header[i] for i in year_ix)
+        i_code, i_iso = position["WEO Subject Code"], position["ISO"]
+        i_country = position["Country"]
+        for cells in reader:
+            # data ends with an empty line or footnote line
+            if len(cells) <= i_country or not cells[i_country]:
+                break
+            if len(cells) < len(header):
+                cells += [""] * (len(header) - len(cells))
+            if codes is not None and cells[i_code] not in codes:
+                continue
+            if isos is not None and cells[i_iso] not in isos:
+                continue
+            record = {field: cells[i] if i is not None else "" for i, field in fields}
+            record["estimates_start_after"] = to_year(record["estimates_start_after"])
+            record["years"] = years
+            record["values"] = np.array([to_float(cells[i]) for i in year_ix])
+            yield record if as_dict else Row(**record)
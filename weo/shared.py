@@ -0,0 +1,149 @@
+"""Share one parsed WEO file between many processes.
+
+  # parent process, once (e.g. gunicorn on_starting hook)
+  from weo import WEO
+  from weo.shared import export
+  export(WEO("weo.csv", memory="compact"), "/dev/shm/weo_2024_1")
+
+  # each worker
+  from weo.shared import attach
+  w = attach("/dev/shm/weo_2024_1")
+  w.getc("NGDP_RPCH")
+
+export() writes the value matrix and the metadata columns, text encoded
+as integer codes, to .npy files. Notes are not exported, w.notes reads
+them from the source file on first access. attach() memory-maps these files read-only,
+so the operating system keeps one copy of them in page cache for all
+processes. A worker builds only its own catalog and row index.
+
+Use a directory in /dev/shm (a RAM-backed filesystem on Linux) to keep
+the files in shared memory, or any other directory to keep them on disk.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+from .dataframe import NOTES_COLUMNS, WEO, as_labels, insert_values, year_columns
+
+__all__ = ["export", "attach", "pack", "unpack"]
+
+LAYOUT = "layout.json"
+
+
+def _encode(column: pd.Series):
+    """Return integer codes and list of categories for *column*, -1 is NaN."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes, categories = column.cat.codes.to_numpy(), column.cat.categories
+    else:
+        codes, categories = pd.factorize(column)
+    return codes.astype(np.int32), pd.Index(categories).tolist()
+
+
+def _serializable(source):
+    if source is None:
+        return None
+    filename, cache, subset = source
+    subset = {
+        k: sorted(as_labels(v)) if v is not None else None for k, v in subset.items()
+    }
+    return [str(filename), cache, subset]
+
+
+def pack(w: WEO) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """Split *w* into layout dictionary and numeric arrays: value matrix,
+    row numbers and metadata columns, text columns as integer codes.
+    Notes columns are left out if *w* can read them from its source file.
+    """
+    years = year_columns(w.df)
+    skip = set(years)
+    if w._source is not None:
+        skip.update(NOTES_COLUMNS)
+    metadata = [c for c in w.df.columns if c not in skip]
+    categories: Dict[str, Optional[List]] = {}
+    arrays = {}
+    for i, column in enumerate(metadata):
+        s = w.df[column]
+        if isinstance(s.dtype, np.dtype) and s.dtype.kind in "biuf":
+            # numbers are kept as they are
+            arrays[f"column{i}"], categories[column] = s.to_numpy(), None
+        else:
+            arrays[f"column{i}"], categories[column] = _encode(s)
+    arrays["values"] = np.ascontiguousarray(w.values)
+    arrays["rows"] = w.df.index.to_numpy(dtype=np.int64)
+    before = w.df.columns[: w.df.columns.get_loc(years[0])] if years else metadata
+    layout = dict(
+        columns=metadata,
+        categories=categories,
+        years=years,
+        start=len([c for c in before if c in metadata]),
+        id_column=w.id_column,
+        source=_serializable(w._source),
+    )
+    return layout, arrays
+
+
+def unpack(layout: Dict, arrays: Dict[str, np.ndarray]) -> WEO:
+    """Create WEO from result of pack(), arrays are not copied."""
+    columns = {}
+    for i, column in enumerate(layout["columns"]):
+        categories = layout["categories"][column]
+        if categories is None:
+            columns[column] = arrays[f"column{i}"]
+        else:
+            columns[column] = pd.Categorical.from_codes(
+                arrays[f"column{i}"], categories=categories
+            )
+    metadata = pd.DataFrame(columns, index=pd.Index(arrays["rows"]))
+    values = arrays["values"]
+    df = insert_values(metadata, values, layout["years"], layout["start"])
+    source = layout["source"]
+    return WEO.from_parts(
+        df, values, layout["id_column"], tuple(source) if source else None
+    )
+
+
+def export(w: WEO, directory: str) -> Path:
+    """Write values and metadata of *w* to *directory* for attach().
+
+    Files are written to a temporary folder that replaces *directory*
+    when complete. Processes attached to previous files keep them
+    until they exit.
+    """
+    target = Path(directory)
+    tmp = target.with_name(target.name + f".tmp{os.getpid()}")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    layout, arrays = pack(w)
+    for name, array in arrays.items():
+        np.save(tmp / f"{name}.npy", array)
+    with open(tmp / LAYOUT, "w", encoding="utf-8") as f:
+        json.dump(layout, f)
+    if target.exists():
+        old = target.with_name(target.name + f".old{os.getpid()}")
+        os.replace(target, old)
+        os.replace(tmp, target)
+        shutil.rmtree(old, ignore_errors=True)
+    else:
+        os.replace(tmp, target)
+    return target
+
+
+def attach(directory: str) -> WEO:
+    """Return WEO backed by read-only memory-mapped files in *directory*
+    written by export().
+    """
+    folder = Path(directory)
+    with open(folder / LAYOUT, encoding="utf-8") as f:
+        layout = json.load(f)
+    # plain ndarray views of memory-mapped files, pandas does not need np.memmap
+    arrays = {
+        path.stem: np.load(path, mmap_mode="r").view(np.ndarray)
+        for path in folder.glob("*.npy")
+    }
+    return unpack(layout, arrays)